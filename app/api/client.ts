@@ -1,7 +1,14 @@
 import { MonitorResponse, ConfigResponse, TVDetail, SetWatchRequest, SetTagRequest, SetDownloadStatusRequest, SearchTVResponse, AddTVRequest, AddTVResponse, UpdateSourceRequest, GetDownloadStatusResponse, GetErrorsResponse } from '../types';
 import { API_CONFIG } from '../config';
 
-export const fetchMonitor = async (version: string = ''): Promise<MonitorResponse> => {
+export const imageProxyUrl = (url: string, width: number = 256): string => {
+    if (!url) {
+        return url;
+    }
+    return `${API_CONFIG.BASE_URL}/image?url=${encodeURIComponent(url)}&w=${width}`;
+};
+
+export const fetchMonitor = async (version: string = '', icon_size: number = 256): Promise<MonitorResponse> => {
     try {
         const response = await fetch(`${API_CONFIG.BASE_URL}/api/monitor`, {
             method: 'POST',
@@ -9,7 +16,7 @@ export const fetchMonitor = async (version: string = ''): Promise<MonitorRespons
                 'Content-Type': 'application/json',
                 'Authorization': API_CONFIG.AUTH_HEADER,
             },
-            body: JSON.stringify({ version }),
+            body: JSON.stringify({ version, icon_size }),
         });
 
         if (!response.ok) {
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { View, Text, TextInput, TouchableOpacity, FlatList, StyleSheet, ActivityIndicator, Alert, Modal, Switch, ScrollView, BackHandler } from 'react-native';
-import { searchTV, addTV } from '../api/client';
+import { searchTV, addTV, imageProxyUrl } from '../api/client';
 import { Source, TagConfig } from '../types';
 import { AuthImage } from './AuthImage';
 import { API_CONFIG } from '../config';
@@ -96,7 +96,7 @@ export default function AddTV({ onBack }: Props) {
     const renderItem = ({ item }: { item: Source }) => (
         <TouchableOpacity style={styles.itemContainer} onPress={() => handleAddPress(item)}>
             <AuthImage
-                uri={item.cover_url}
+                uri={imageProxyUrl(item.cover_url)}
                 headers={{ Authorization: API_CONFIG.AUTH_HEADER }}
                 style={styles.itemImage}
                 resizeMode="cover"
@@ -2,6 +2,7 @@ import React, { useEffect, useState, useRef } from 'react';
 import { View, Text, StyleSheet, ActivityIndicator, TouchableOpacity, ScrollView, Alert, BackHandler, Modal, TextInput, FlatList, Switch, StatusBar, AppState } from 'react-native';
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { useClient } from '../context/ClientProvider';
+import { imageProxyUrl } from '../api/client';
 import { TVDetail as TVDetailType, Episode, TagConfig, Source } from '../types';
 import VideoPlayer from './VideoPlayer';
 import { useDownload } from '../context/DownloadContext';
@@ -674,7 +675,7 @@ export default function TVDetail({ tvId, onBack, onFullScreenChange }: Props) {
                                         onPress={() => handleSourceSelect(item)}
                                     >
                                         <AuthImage
-                                            uri={item.cover_url}
+                                            uri={imageProxyUrl(item.cover_url)}
                                             headers={{ Authorization: API_CONFIG.AUTH_HEADER }}
                                             style={styles.sourceItemImage}
                                             resizeMode="cover"
@@ -0,0 +1,163 @@
+from schema.config import Config
+from searcher.searcher import Searcher
+from searcher.searchers import searcher_config
+from searcher.resource_searcher.web import WebResourceSearcher
+from utils.context import Context
+from utils import fixture, html_parser
+from aiohttp import web
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+_parse = html_parser._parse
+
+
+def collect_parse_jobs(jobs):
+    def collecting_parse(func, src, text, features, args):
+        jobs.append((func, src, text, features, args))
+        return _parse(func, src, text, features, args)
+    html_parser._parse = collecting_parse
+
+
+def bench_job(job, rounds):
+    tracemalloc.start()
+    _parse(*job)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _parse(*job)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), peak
+
+
+def bench_stage(prefix, jobs, rounds):
+    stats = [bench_job(job, rounds) for job in jobs]
+    return {
+        prefix + "pages": len(stats),
+        prefix + "parse_time": sum(i[0] for i in stats),
+        prefix + "peak_alloc": max((i[1] for i in stats), default=0),
+    }
+
+
+def episode_urls(sources, count):
+    urls = []
+    for source in sources:
+        for episode in source.episodes[:count]:
+            if episode.url not in urls:
+                urls.append(episode.url)
+        if len(urls) >= count:
+            break
+    return urls[:count]
+
+
+async def start_replay_server(fixture_dir):
+    app = web.Application()
+    app.add_routes(fixture.replay_routes(fixture_dir))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    os.environ[fixture.REPLAY_ENV] = f"http://127.0.0.1:{port}"
+    return runner
+
+
+async def run(args):
+    configs = [i for i in searcher_config()["searchers"] if i["enable"]]
+    if args.keys:
+        configs = [i for i in configs if i["key"] in args.keys]
+    if args.record:
+        os.environ[fixture.RECORD_ENV] = args.fixtures
+    else:
+        runner = await start_replay_server(args.fixtures)
+    jobs = []
+    collect_parse_jobs(jobs)
+    result = {}
+    config = Config.model_validate({"parser": {"workers": 0}})
+    async with Context(config=config):
+        for searcher_cfg in configs:
+            searcher = Searcher(searcher_cfg)
+            jobs.clear()
+            try:
+                sources = await searcher.search_impl(args.keyword or searcher.self_test_keyword)
+            except Exception as e:
+                print(f"{searcher.key}: search failed: {e!r}")
+                continue
+            search_jobs = list(jobs)
+            jobs.clear()
+            if isinstance(searcher.resource_searcher, WebResourceSearcher):
+                for url in episode_urls(sources, args.episodes):
+                    try:
+                        await searcher.get_video(url)
+                    except Exception as e:
+                        print(f"{searcher.key}: resolve {url} failed: {e!r}")
+            resource_jobs = list(jobs)
+            if args.record:
+                print(f"{searcher.key}: recorded {len(search_jobs)} search pages, "
+                      f"{len(resource_jobs)} resource pages")
+                continue
+            result[searcher.key] = {
+                **bench_stage("", search_jobs, args.rounds),
+                **bench_stage("resource_", resource_jobs, args.rounds),
+            }
+            stats = result[searcher.key]
+            print(f"{searcher.key}: pages={stats['pages']} "
+                  f"parse_time={stats['parse_time'] * 1000:.2f}ms "
+                  f"peak_alloc={stats['peak_alloc'] / 1024:.0f}KB "
+                  f"resource_pages={stats['resource_pages']} "
+                  f"resource_parse_time={stats['resource_parse_time'] * 1000:.2f}ms")
+    if not args.record:
+        await runner.cleanup()
+    return result
+
+
+def compare(result, baseline, tolerance):
+    regressions = []
+    for key, stats in result.items():
+        if key not in baseline:
+            continue
+        for metric in ("parse_time", "resource_parse_time"):
+            if metric not in baseline[key]:
+                continue
+            limit = baseline[key][metric] * (1 + tolerance)
+            if stats[metric] > limit:
+                regressions.append(
+                    f"{key} {metric}: {stats[metric] * 1000:.2f}ms > {limit * 1000:.2f}ms")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", default="bench/fixtures",
+                        help="fixture directory")
+    parser.add_argument("--record", default=False, action="store_true",
+                        help="record fixtures from the live sites")
+    parser.add_argument("--keys", nargs="*", help="searcher keys to run")
+    parser.add_argument("--keyword", default="",
+                        help="search keyword, defaults to self test keyword")
+    parser.add_argument("--rounds", default=20, type=int)
+    parser.add_argument("--episodes", default=3, type=int,
+                        help="episode pages to resolve per searcher")
+    parser.add_argument("--output", default="", help="write result json")
+    parser.add_argument("--baseline", default="",
+                        help="fail if slower than this result json")
+    parser.add_argument("--tolerance", default=0.2, type=float)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(json.dumps(result, indent=2))
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            exit(1)
@@ -0,0 +1,69 @@
+from utils.run_cmd import run_cmd, low_priority_cmd
+import asyncio
+import os
+import struct
+
+_TMP_SUFFIX = ".faststart.tmp"
+
+
+def top_level_atoms(path):
+    atoms = []
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        offset = 0
+        while offset + 8 <= file_size:
+            f.seek(offset)
+            size, kind = struct.unpack(">I4s", f.read(8))
+            if size == 1:
+                size = struct.unpack(">Q", f.read(8))[0]
+            elif size == 0:
+                size = file_size - offset
+            if size < 8:
+                raise ValueError(f"invalid atom size {size} at {offset} in {path}")
+            atoms.append(kind.decode("latin-1"))
+            offset += size
+    return atoms
+
+
+def is_faststart(path):
+    atoms = top_level_atoms(path)
+    if "moov" not in atoms:
+        raise ValueError(f"moov atom not found in {path}")
+    if "mdat" not in atoms:
+        return True
+    return atoms.index("moov") < atoms.index("mdat")
+
+
+def faststart_tmp(path):
+    directory, name = os.path.split(path)
+    return os.path.join(directory, "." + name + _TMP_SUFFIX)
+
+
+def is_faststart_tmp(name):
+    return name.startswith(".") and name.endswith(_TMP_SUFFIX)
+
+
+async def make_faststart(src, dst, low_priority=False):
+    cmd = low_priority_cmd() if low_priority else []
+    await run_cmd(*cmd, "ffmpeg", "-y", "-i", src, "-map", "0", "-c", "copy",
+                  "-f", "mp4", "-movflags", "+faststart", dst)
+
+
+async def ensure_faststart(path, low_priority=False):
+    loop = asyncio.get_running_loop()
+    if await loop.run_in_executor(None, is_faststart, path):
+        return False
+    tmp = faststart_tmp(path)
+    try:
+        await make_faststart(path, tmp, low_priority)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return True
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(top_level_atoms(sys.argv[-1]), is_faststart(sys.argv[-1]))
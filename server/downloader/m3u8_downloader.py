@@ -68,7 +68,7 @@ class M3U8Downloader:
 
         await run_cmd(
             "ffmpeg", "-y", "-allowed_extensions", "ALL", "-i", src_m3u8, "-acodec", "copy", "-vcodec", "copy",
-            "-bsf:a", "aac_adtstoasc", dst)
+            "-bsf:a", "aac_adtstoasc", "-movflags", "+faststart", dst)
 
     async def run(self):
         async with Context.tempdir() as tmp:
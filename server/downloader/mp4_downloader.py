@@ -1,6 +1,7 @@
 from .download_tracker import DownloadTracker
 from .simple_downloader import SimpleDownloader
 from utils.run_cmd import run_cmd
+from .faststart import ensure_faststart
 import asyncio
 from utils.context import Context
 
@@ -17,6 +18,11 @@ class MP4Downloader:
             self.download_tracker = DownloadTracker(1)
             self.status = "downloading"
             await SimpleDownloader(self.src, output_file, self.download_tracker).run()
+            self.status = "faststart"
+            try:
+                await ensure_faststart(output_file)
+            except ValueError as e:
+                Context.warning(f"faststart {self.src} skipped: {e}")
             self.status = "copy result"
             await run_cmd("cp", output_file, self.dst + ".tmp")
             await run_cmd("mv", self.dst + ".tmp", self.dst)
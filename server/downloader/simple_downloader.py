@@ -1,4 +1,5 @@
 from utils.context import Context
+from utils import http_client
 import aiohttp
 
 HEADERS = {
@@ -13,7 +14,7 @@ class SimpleDownloader:
         self.download_tracker = download_tracker
 
     async def run(self):
-        async with Context.client.get(self.src, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=5*60)) as resp:
+        async with http_client.get(self.src, use_bucket=False, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=5*60)) as resp:
             resp.raise_for_status()
             if self.download_tracker is not None:
                 self.download_tracker.add_fragment(resp.content_length)
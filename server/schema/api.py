@@ -4,6 +4,7 @@ from .dtype import TVTrackBaseModel
 from .db import Source, ErrorDB, WatchStatus, LocalStore
 from .config import TagConfig
 from typing import Optional
+from datetime import datetime
 
 
 class Monitor(TVTrackBaseModel):
@@ -17,6 +18,7 @@ class Monitor(TVTrackBaseModel):
 
     class Request(TVTrackBaseModel):
         version: str
+        icon_size: int = 0
 
     class Response(TVTrackBaseModel):
         is_new: bool
@@ -48,6 +50,20 @@ class SearchTV(TVTrackBaseModel):
         source: list[Source]
 
 
+class SearchTVStream(TVTrackBaseModel):
+    class Summary(TVTrackBaseModel):
+        searchers: list[str] = []
+        timeout: list[str] = []
+
+    class Request(TVTrackBaseModel):
+        keyword: str
+
+    class Chunk(TVTrackBaseModel):
+        searcher: str = ""
+        source: list[Source] = []
+        summary: Optional["SearchTVStream.Summary"] = None
+
+
 class AddTV(TVTrackBaseModel):
     class Request(TVTrackBaseModel):
         name: str
@@ -98,11 +114,14 @@ class GetDownloadStatus:
 
 class GetErrors(TVTrackBaseModel):
     class Request(TVTrackBaseModel):
-        pass
+        offset: int = 0
+        limit: int = 0
 
     class Response(TVTrackBaseModel):
         critical_errors: list[ErrorDB.Error]
         errors: list[ErrorDB.Error]
+        total_critical_errors: int = 0
+        total_errors: int = 0
 
 
 class ClearErrors(TVTrackBaseModel):
@@ -188,3 +207,22 @@ class RunSystemOperation(TVTrackBaseModel):
 
     class Response(TVTrackBaseModel):
         pass
+
+
+class GetSearcherHealth(TVTrackBaseModel):
+    class Health(TVTrackBaseModel):
+        key: str
+        name: str
+        state: str
+        requests: int
+        success_rate: float
+        p50_latency: float
+        p95_latency: float
+        last_error: str = ""
+        last_error_time: Optional[datetime] = None
+
+    class Request(TVTrackBaseModel):
+        pass
+
+    class Response(TVTrackBaseModel):
+        searchers: list["GetSearcherHealth.Health"]
@@ -46,6 +46,7 @@ class ServiceConfig(TVTrackBaseModel):
     port: int = 0
     auth_username: str = ""
     auth_password: str = ""
+    compress_min_size: int = 1024
 
 
 class LoggerConfig(TVTrackBaseModel):
@@ -67,12 +68,77 @@ class DownloadConfig(TVTrackBaseModel):
     retry_interval: TimeDelta = "1m"
     timeout: TimeDelta = "1h"
     tmp_dir: str = "/tmp/tv_track"
+    faststart_interval: TimeDelta = "10m"
+    faststart_batch: int = 5
+
+
+_DEFAULT_TAG_INTERVAL_SCALE = {
+    "dropped": 24,
+    "saved": 24,
+}
 
 
 class SourceUpdaterConfig(TVTrackBaseModel):
     update_interval: TimeDelta = "1h"
+    check_interval: TimeDelta = "5m"
+    max_interval: TimeDelta = "7d"
+    release_window: TimeDelta = "6h"
+    quiet_timeout: TimeDelta = "3d"
+    release_history: int = 10
+    min_release_history: int = 3
+    tag_interval_scale: dict[str, float] = _DEFAULT_TAG_INTERVAL_SCALE
     notrack_timeout: TimeDelta = "30d"
     max_error_times: int = 5
+    concurrent: int = 4
+    searcher_concurrent: int = 1
+    spread: float = 0.5
+
+
+class SearchConfig(TVTrackBaseModel):
+    cache_ttl: TimeDelta = "10m"
+    cache_stale_ttl: TimeDelta = "1d"
+    cache_size: int = 256
+    searcher_timeout: TimeDelta = "20s"
+    reload_interval: TimeDelta = "10s"
+
+
+class HttpConfig(TVTrackBaseModel):
+    rate: float = 5
+    burst: int = 10
+    max_retry: int = 3
+    backoff_base: TimeDelta = "2s"
+    backoff_max: TimeDelta = "1m"
+    domain_rate: dict[str, float] = {}
+
+
+class ParserConfig(TVTrackBaseModel):
+    workers: int = 2
+
+
+class AudioConfig(TVTrackBaseModel):
+    stream: bool = True
+    cache_size_mb: int = 4096
+    prefetch: bool = True
+    prefetch_tags: list[str] = ["watching"]
+    prefetch_episodes: int = 2
+    prefetch_concurrent: int = 1
+
+
+class BrowserConfig(TVTrackBaseModel):
+    idle_timeout: TimeDelta = "10m"
+    workers: int = 1
+    job_timeout: TimeDelta = "3m"
+    max_jobs: int = 50
+
+
+class ThumbnailConfig(TVTrackBaseModel):
+    workers: int = 1
+    sizes: list[int] = [128, 256, 512]
+
+
+class ImageProxyConfig(TVTrackBaseModel):
+    cache_size_mb: int = 512
+    max_size_mb: int = 10
 
 
 class ErrorConfig(TVTrackBaseModel):
@@ -101,6 +167,13 @@ class Config(TVTrackBaseModel):
     tracker: TrackerConfig = TrackerConfig()
     download: DownloadConfig = DownloadConfig()
     source_updater: SourceUpdaterConfig = SourceUpdaterConfig()
+    search: SearchConfig = SearchConfig()
+    parser: ParserConfig = ParserConfig()
+    http: HttpConfig = HttpConfig()
+    browser: BrowserConfig = BrowserConfig()
+    audio: AudioConfig = AudioConfig()
+    thumbnail: ThumbnailConfig = ThumbnailConfig()
+    image_proxy: ImageProxyConfig = ImageProxyConfig()
     monitor: MonitorConfig = MonitorConfig()
     system_status: SystemStatusConfig = SystemStatusConfig()
     api_key: APIKey = APIKey()
@@ -31,9 +31,12 @@ class LocalStore(TVTrackBaseModel):
         filename: str = ""
         download: "LocalStore.DownloadStatus" = "running"
         download_error: Optional[str] = None
+        faststart: bool = False
+        faststart_failures: int = 0
 
     episodes: list["LocalStore.Episode"] = []
     cover: Optional[str] = None
+    thumbnails: dict[int, str] = {}
 
 
 class WatchStatus(TVTrackBaseModel):
@@ -64,10 +67,29 @@ class ErrorDB(TVTrackBaseModel):
         timestamp: datetime
         title: str
         error: str
+        count: int = 1
     critical_errors: list["ErrorDB.Error"] = []
     errors: list["ErrorDB.Error"] = []
     next_id: int = 1
 
 
+class UpdateSchedule(TVTrackBaseModel):
+    releases: list[datetime] = []
+    next_update: Optional[datetime] = None
+    error_times: int = 0
+
+
+class ScheduleDB(TVTrackBaseModel):
+    tv: dict[int, UpdateSchedule] = {}
+
+
 class AdBlockDB(TVTrackBaseModel):
     ts_black_list: set[str] = set()
+
+
+class RecipeDB(TVTrackBaseModel):
+    class Recipe(TVTrackBaseModel):
+        regex: str
+        encoding: str = "raw"
+        failures: int = 0
+    recipes: dict[str, "RecipeDB.Recipe"] = {}
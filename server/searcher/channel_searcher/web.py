@@ -1,18 +1,65 @@
-from utils.beautiful import request
-import asyncio
+from utils.beautiful import request_page
+from utils.page_cache import PageCache, PageState
+from utils.html_parser import parse_html
+import hashlib
 import re
 
 
+def _digest(text):
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
 class WebChannelSearcher:
-    def __init__(self, filter=None, **kwargs):
+    def __init__(self, filter=None, parser="lxml", **kwargs):
         if filter is None:
             self.filter = None
         else:
             self.filter = re.compile(filter)
+        self.parser = parser
+        self.page_cache = PageCache()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["page_cache"]
+        return state
+
+    def region(self, soup):
+        return [soup]
+
+    def parse_changed(self, src, soup, region_digest):
+        new_region_digest = _digest("".join(str(i) for i in self.region(soup)))
+        if new_region_digest == region_digest:
+            return new_region_digest, None
+        return new_region_digest, self.parse(src, soup)
+
+    async def fetch(self, url):
+        state = self.page_cache.get(url)
+        if state is None:
+            page = await request_page(url)
+        else:
+            page = await request_page(url, state.etag, state.last_modified)
+            if page is None:
+                return state.result
+        digest = _digest(page.text)
+        if state is not None and state.digest == digest:
+            result = state.result
+            region_digest = state.region_digest
+        else:
+            region_digest, result = await parse_html(
+                self.parse_changed, url, page.text, self.parser,
+                state.region_digest if state is not None else None)
+            if result is None:
+                result = state.result
+        self.page_cache.put(url, PageState(
+            etag=page.etag,
+            last_modified=page.last_modified,
+            digest=digest,
+            region_digest=region_digest,
+            result=result))
+        return result
 
     async def search(self, url):
-        soup = await request(url)
-        result = self.parse(url, soup)
+        result = await self.fetch(url)
         if self.filter is None:
             return result
         else:
@@ -1,5 +1,6 @@
 from .web import WebChannelSearcher
 from utils.beautiful import to_text
+from utils.html_parser import select, select_one, compile_selector
 import urllib
 from schema.searcher import Channel
 
@@ -22,13 +23,21 @@ class WebAChannelSearcher(WebChannelSearcher):
         self.episode_links_from_list = episode_links_from_list
         self.cover = cover
         self.cover_attr = cover_attr
+        for selector in [channel_names, episode_lists, episodes_from_list, episode_links_from_list, cover]:
+            if selector:
+                compile_selector(selector)
+
+    def region(self, soup):
+        selectors = [self.channel_names, self.episode_lists, self.cover]
+        return [i for selector in selectors if selector
+                for i in select(soup, selector)]
 
     def parse_episode_list(self, src, list):
-        episodes_tag = [i for i in list.select(self.episodes_from_list)]
+        episodes_tag = [i for i in select(list, self.episodes_from_list)]
         if self.episode_links_from_list:
             episode_links = [
                 i["href"]
-                for i in list.select(self.episode_links_from_list)
+                for i in select(list, self.episode_links_from_list)
                 if i.has_attr("href") and i["href"] != ""
             ]
         else:
@@ -53,17 +62,17 @@ class WebAChannelSearcher(WebChannelSearcher):
     def parse(self, src, soup):
         if self.channel_names:
             channel_names = [to_text(i)
-                             for i in soup.select(self.channel_names)]
+                             for i in select(soup, self.channel_names)]
         else:
             channel_names = ["default"]
         if self.cover:
             cover = urllib.parse.urljoin(
-                src, soup.select_one(self.cover)[self.cover_attr])
+                src, select_one(soup, self.cover)[self.cover_attr])
         else:
             cover = ""
         episode_lists = [
             self.parse_episode_list(src, i)
-            for i in soup.select(self.episode_lists)
+            for i in select(soup, self.episode_lists)
         ]
         return [
             Channel(name=name, episodes=l, cover_url=cover)
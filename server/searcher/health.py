@@ -0,0 +1,81 @@
+from collections import deque
+from datetime import datetime
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class NotFoundError(RuntimeError):
+    pass
+
+
+class SearcherHealth:
+    _WINDOW = 100
+    _FAILURE_THRESHOLD = 5
+    _OPEN_INTERVAL = 300
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self):
+        self.records = deque(maxlen=SearcherHealth._WINDOW)
+        self.failures = 0
+        self.state = SearcherHealth.CLOSED
+        self.opened_at = 0
+        self.probing = False
+        self.last_error = ""
+        self.last_error_time = None
+
+    def allow(self):
+        if self.state == SearcherHealth.OPEN and time.monotonic() - self.opened_at >= SearcherHealth._OPEN_INTERVAL:
+            self.state = SearcherHealth.HALF_OPEN
+        if self.state == SearcherHealth.CLOSED:
+            return True
+        if self.state == SearcherHealth.HALF_OPEN and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record(self, ok, latency, error=""):
+        self.records.append((ok, latency))
+        if ok:
+            self.failures = 0
+            self.state = SearcherHealth.CLOSED
+            return
+        self.failures += 1
+        self.last_error = error
+        self.last_error_time = datetime.now()
+        if self.state == SearcherHealth.HALF_OPEN or self.failures >= SearcherHealth._FAILURE_THRESHOLD:
+            self.state = SearcherHealth.OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(self, func, force=False):
+        if not force and not self.allow():
+            raise CircuitOpenError("circuit open")
+        start = time.monotonic()
+        try:
+            result = await func()
+        except NotFoundError:
+            self.record(True, time.monotonic() - start)
+            raise
+        except Exception as e:
+            self.record(False, time.monotonic() - start, repr(e))
+            raise
+        finally:
+            self.probing = False
+        self.record(True, time.monotonic() - start)
+        return result
+
+    def success_rate(self):
+        if not self.records:
+            return 1.0
+        return sum(1 for ok, _ in self.records if ok) / len(self.records)
+
+    def latency(self, percentile):
+        latencies = sorted(latency for _, latency in self.records)
+        if not latencies:
+            return 0.0
+        return latencies[int(percentile * (len(latencies) - 1))]
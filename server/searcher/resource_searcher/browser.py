@@ -3,6 +3,7 @@ from urllib.parse import urlparse, parse_qs
 import asyncio
 import re
 from schema.searcher import Resource
+from . import recipe
 
 
 class RequestResourceHandler:
@@ -17,29 +18,40 @@ class RequestResourceHandler:
             self.event.set()
         await route.continue_()
 
+    @staticmethod
+    async def resolve(url, pattern):
+        pool = Context.get_meta("resolver_pool")
+        if pool is not None:
+            return await pool.resolve(url, pattern.pattern)
+        return await RequestResourceHandler.get(url, pattern)
+
     @staticmethod
     async def get(url, pattern):
         result = RequestResourceHandler(pattern)
-        page = await Context.browser.new_page()
-        await page.route("**/*", result.handle_request)
-        await page.goto(url, timeout=60000)
-        await page.title()
-        try:
+        async with Context.browser.page() as page:
+            await page.route("**/*", result.handle_request)
+            await page.goto(url, timeout=60000)
+            await page.title()
             await asyncio.wait_for(result.event.wait(), timeout=60)
             return result.result
-        finally:
-            await page.close()
 
 
 class BrowserResourceSearcher:
-    def __init__(self, pattern="https?://.*\\.(mp4|m3u8)", file_type="auto", **kwargs):
+    def __init__(self, pattern="https?://.*\\.(mp4|m3u8)", file_type="auto", learn_recipe=True, **kwargs):
         self.pattern = re.compile(pattern)
         self.file_type = file_type
+        self.learn_recipe = learn_recipe
 
     async def search(self, url):
-        video_url = await RequestResourceHandler.get(url, self.pattern)
+        video_url = None
+        if self.learn_recipe:
+            video_url = await recipe.resolve(url, self.pattern)
         if video_url is None:
-            raise ValueError(f"cannot get resource: {url}")
+            video_url = await RequestResourceHandler.resolve(url, self.pattern)
+            if video_url is None:
+                raise ValueError(f"cannot get resource: {url}")
+            if self.learn_recipe:
+                await recipe.learn(url, video_url)
         parsed_url = urlparse(video_url)
         query_params = parse_qs(parsed_url.query)
         if "url" in query_params:
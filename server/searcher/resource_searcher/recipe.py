@@ -0,0 +1,99 @@
+from utils.context import Context
+from utils.beautiful import request_text
+from schema.db import RecipeDB
+from urllib.parse import urlparse, quote, unquote
+import html
+import re
+
+_PREFIX_LENGTHS = (8, 16, 32, 64)
+_MAX_FAILURES = 3
+
+_ENCODINGS = {
+    "raw": (lambda url: url, r"""[^"'\s<>\\]+""", lambda text: text),
+    "html": (lambda url: url.replace("&", "&amp;"), r"""[^"'\s<>\\]+""", html.unescape),
+    "json": (lambda url: url.replace("/", "\\/"), r"""(?:[^"'\s<>\\]|\\/)+""", lambda text: text.replace("\\/", "/")),
+    "quote": (lambda url: quote(url, safe=""), r"""[^&"'\s<>\\]+""", unquote),
+}
+
+_local_db = RecipeDB()
+
+
+def recipe_db():
+    db_manager = Context.get_meta("db_manager")
+    if db_manager is None:
+        return _local_db, lambda: None
+    return db_manager.recipe(), db_manager.recipe_dirty
+
+
+def recipe_key(url):
+    return urlparse(url).netloc
+
+
+def apply_recipe(recipe, text):
+    _, _, decode = _ENCODINGS[recipe.encoding]
+    search = re.search(recipe.regex, text)
+    if search is None:
+        return None
+    return decode(search.group(1))
+
+
+def derive_recipe(text, video_url):
+    for encoding, (encode, capture, decode) in _ENCODINGS.items():
+        encoded = encode(video_url)
+        pos = text.find(encoded)
+        if pos < 0:
+            continue
+        for length in _PREFIX_LENGTHS:
+            prefix = text[max(0, pos - length):pos]
+            if "\n" in prefix:
+                prefix = prefix[prefix.rindex("\n") + 1:]
+            if not prefix:
+                break
+            recipe = RecipeDB.Recipe(
+                regex=re.escape(prefix) + "(" + capture + ")", encoding=encoding)
+            if apply_recipe(recipe, text) == video_url:
+                return recipe
+    return None
+
+
+async def resolve(url, pattern):
+    db, dirty = recipe_db()
+    recipe = db.recipes.get(recipe_key(url))
+    if recipe is None:
+        return None
+    try:
+        video_url = apply_recipe(recipe, await request_text(url))
+    except Exception as e:
+        Context.warning(f"recipe resolve {url} error: {e}")
+        video_url = None
+    if video_url is not None and pattern.search(video_url):
+        if recipe.failures:
+            recipe.failures = 0
+            dirty()
+        return video_url
+    recipe.failures += 1
+    if recipe.failures >= _MAX_FAILURES:
+        Context.info(f"drop recipe for {recipe_key(url)}")
+        db.recipes.pop(recipe_key(url), None)
+    dirty()
+    return None
+
+
+async def learn(url, video_url):
+    db, dirty = recipe_db()
+    try:
+        recipe = derive_recipe(await request_text(url), video_url)
+    except Exception as e:
+        Context.warning(f"recipe learn {url} error: {e}")
+        return
+    if recipe is not None:
+        Context.info(f"learn recipe for {recipe_key(url)}: {recipe.regex}")
+        db.recipes[recipe_key(url)] = recipe
+        dirty()
+
+
+if __name__ == "__main__":
+    text = '<script>var player = {"url":"https:\\/\\/cdn.example.com\\/v\\/1.m3u8?t=1&e=2","next":""}</script>'
+    recipe = derive_recipe(text, "https://cdn.example.com/v/1.m3u8?t=1&e=2")
+    print(recipe)
+    print(apply_recipe(recipe, text.replace("1.m3u8", "2.m3u8")))
@@ -0,0 +1,114 @@
+from utils.context import Context
+from pathlib import Path
+import asyncio
+import json
+import sys
+
+_WORKER_MODULE = "searcher.resource_searcher.resolver_worker"
+_SERVER_DIR = Path(__file__).parent.parent.parent
+_CLOSE_TIMEOUT = 10
+
+
+class ResolveError(RuntimeError):
+    pass
+
+
+class ResolverProcess:
+    def __init__(self, config_json):
+        self.config_json = config_json
+        self.process = None
+        self.jobs = 0
+
+    async def start(self):
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", _WORKER_MODULE, cwd=_SERVER_DIR,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE)
+        self.process.stdin.write(self.config_json.encode() + b"\n")
+        await self.process.stdin.drain()
+
+    def alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def resolve(self, url, pattern, timeout):
+        self.jobs += 1
+        job = json.dumps({"url": url, "pattern": pattern})
+        self.process.stdin.write(job.encode() + b"\n")
+        await self.process.stdin.drain()
+        line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        if not line:
+            raise RuntimeError(
+                f"resolver worker exited: returncode={await self.process.wait()}")
+        result = json.loads(line)
+        if "error" in result:
+            raise ResolveError(result["error"])
+        return result["url"]
+
+    def kill(self):
+        if self.alive():
+            self.process.kill()
+
+    async def close(self):
+        if not self.alive():
+            return
+        self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), _CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+
+
+class ResolverPool:
+    def __init__(self, config):
+        self.config_json = config.model_dump_json()
+        self.timeout = config.browser.job_timeout.total_seconds()
+        self.max_jobs = config.browser.max_jobs
+        self.semaphore = asyncio.Semaphore(config.browser.workers)
+        self.idle = []
+        self.processes = set()
+
+    async def acquire(self):
+        while self.idle:
+            process = self.idle.pop()
+            if process.alive():
+                return process
+            self.processes.discard(process)
+        process = ResolverProcess(self.config_json)
+        self.processes.add(process)
+        await process.start()
+        return process
+
+    async def release(self, process, healthy):
+        if healthy and process.alive() and process.jobs < self.max_jobs:
+            self.idle.append(process)
+            return
+        self.processes.discard(process)
+        if not healthy:
+            process.kill()
+        await process.close()
+
+    async def resolve(self, url, pattern):
+        async with self.semaphore:
+            process = await self.acquire()
+            healthy = False
+            try:
+                result = await process.resolve(url, pattern, self.timeout)
+                healthy = True
+                return result
+            except ResolveError:
+                healthy = True
+                raise
+            except asyncio.TimeoutError:
+                Context.warning(f"resolver worker timeout: {url}")
+                raise
+            finally:
+                await self.release(process, healthy)
+
+    async def close(self):
+        self.idle = []
+        await asyncio.gather(*[process.close() for process in self.processes])
+        self.processes.clear()
+
+    def kill(self):
+        for process in self.processes:
+            process.kill()
@@ -0,0 +1,34 @@
+from utils.context import Context
+from schema.config import Config
+from .browser import RequestResourceHandler
+import asyncio
+import json
+import os
+import re
+import sys
+
+
+async def serve(out):
+    loop = asyncio.get_running_loop()
+    config = Config.model_validate_json(await loop.run_in_executor(None, sys.stdin.readline))
+    config.logger.filename = ""
+    config.browser.workers = 0
+    async with Context(config, use_client=False, use_browser=True):
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            job = json.loads(line)
+            try:
+                url = await RequestResourceHandler.get(job["url"], re.compile(job["pattern"]))
+                result = {"url": url}
+            except Exception as e:
+                result = {"error": f"{type(e).__name__}: {e}"}
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+
+
+if __name__ == "__main__":
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    asyncio.run(serve(out))
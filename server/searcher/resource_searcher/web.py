@@ -1,12 +1,11 @@
-import asyncio
-from utils.beautiful import request, to_text
+from utils.beautiful import request_text
+from utils.html_parser import parse_html
 
 
 class WebResourceSearcher:
-    def __init__(self, **kwargs):
-        pass
+    def __init__(self, parser="lxml", **kwargs):
+        self.parser = parser
 
     async def search(self, url):
-        soup = await request(url)
-        result = self.parse(url, soup)
-        return result
+        text = await request_text(url)
+        return await parse_html(self.parse, url, text, self.parser)
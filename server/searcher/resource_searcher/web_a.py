@@ -3,6 +3,7 @@ import re
 import json
 import urllib
 from schema.searcher import Resource
+from utils.html_parser import select
 
 
 class WebAResourceSearcher(WebResourceSearcher):
@@ -13,7 +14,7 @@ class WebAResourceSearcher(WebResourceSearcher):
         self.file_type = file_type
 
     def parse(self, src, soup):
-        scripts = soup.select("script")
+        scripts = select(soup, "script")
         for script in scripts:
             search = self.regex.search(script.text)
             if search:
@@ -3,10 +3,15 @@ from .subject_searcher.subject_searcher import create_subject_searcher
 from .channel_searcher.channel_searcher import create_channel_searcher
 from schema.db import Source
 from utils.context import Context
+from utils.single_flight import SingleFlight
+from utils.parallel_runner import bounded_gather
+from .health import SearcherHealth, NotFoundError
 
 
 class Searcher:
     _SELFTEST_MAX_ERROR_TIME = 3
+    _UPDATE_SHARE_TTL = 300
+    _DEFAULT_CONCURRENT = 4
 
     def __init__(self, config):
         self.resource_searcher = create_resource_searcher(
@@ -17,47 +22,71 @@ class Searcher:
             config["channel_searcher"])
         self.key = config["key"]
         self.name = config["name"]
+        self.concurrent = config.get(
+            "concurrent", Searcher._DEFAULT_CONCURRENT)
         self.self_test_keyword = config["self_test"]["keyword"]
         self.selftest_error_time = 0
+        self.update_flight = SingleFlight(ttl=Searcher._UPDATE_SHARE_TTL)
+        self.health = SearcherHealth()
 
-    async def search(self, keyword):
+    async def search_subject(self, subject):
+        channels = await self.channel_searcher.search(subject.url)
+        return [Source(
+            source_key=self.key,
+            name=f"{subject.name} - {self.name} - {channel.name}",
+            title=subject.name,
+            channel_name=channel.name,
+            url=subject.url,
+            cover_url=subject.cover_url or channel.cover_url,
+            tracking=False,
+            episodes=[Source.Episode(
+                source_key=self.key,
+                name=e.name, url=e.url) for e in channel.episodes],
+        ) for channel in channels]
+
+    async def search(self, keyword, force=False):
+        return await self.health.call(lambda: self.search_impl(keyword), force)
+
+    async def search_impl(self, keyword):
         try:
-            results = []
             subjects = await self.subject_searcher.search(keyword)
-            for subject in subjects:
-                channels = await self.channel_searcher.search(subject.url)
-                for channel in channels:
-                    results.append(Source(
-                        source_key=self.key,
-                        name=f"{subject.name} - {self.name} - {channel.name}",
-                        title=subject.name,
-                        channel_name=channel.name,
-                        url=subject.url,
-                        cover_url=subject.cover_url or channel.cover_url,
-                        tracking=False,
-                        episodes=[Source.Episode(
-                            source_key=self.key,
-                            name=e.name, url=e.url) for e in channel.episodes],
-                    ))
-            return results
+            results = await bounded_gather(
+                [self.search_subject(subject) for subject in subjects],
+                self.concurrent, return_exceptions=True)
         except:
             raise RuntimeError("search error: ", self.name, keyword)
+        errors = []
+        for subject, result in zip(subjects, results):
+            if isinstance(result, Exception):
+                Context.warning(
+                    f"search subject {subject.url} on {self.key} error: {result!r}")
+                errors.append(result)
+        if subjects and len(errors) == len(subjects):
+            raise RuntimeError("search error: ", self.name,
+                               keyword) from errors[0]
+        return sum([i for i in results if not isinstance(i, Exception)], [])
 
     async def update(self, source: Source):
+        return await self.health.call(lambda: self.update_impl(source))
+
+    async def update_impl(self, source: Source):
         try:
-            channels = await self.channel_searcher.search(source.url)
-            for channel in channels:
-                if channel.name == source.channel_name:
-                    rst = source.model_copy()
-                    rst.episodes = [Source.Episode(
-                        source_key=self.key,
-                        name=e.name, url=e.url) for e in channel.episodes]
-                    return rst
-            else:
-                raise RuntimeError(
-                    f"channel not found: {source.channel_name} channel found: {[i.name for i in channels]}")
+            channels = await self.update_flight.do(
+                source.url, lambda: self.channel_searcher.search(source.url))
         except:
             raise RuntimeError("update error: ", self.name, source.name)
+        for channel in channels:
+            if channel.name == source.channel_name:
+                if len(channel.episodes) == len(source.episodes):
+                    return source
+                rst = source.model_copy()
+                rst.episodes = [Source.Episode(
+                    source_key=self.key,
+                    name=e.name, url=e.url) for e in channel.episodes]
+                return rst
+        raise NotFoundError(
+            "update error: ", self.name, source.name,
+            f"channel not found: {source.channel_name} channel found: {[i.name for i in channels]}")
 
     async def get_video(self, url):
         return await self.resource_searcher.search(url)
@@ -65,7 +94,7 @@ class Searcher:
     async def self_test(self):
         with Context.handle_error_context(f"self test {self.key} error", type="critical"):
             try:
-                rst = await self.search(self.self_test_keyword)
+                rst = await self.search(self.self_test_keyword, force=True)
                 example_video = await self.get_video(rst[0].episodes[0].url)
                 if example_video is None:
                     raise RuntimeError("self test error: ", self.name,
@@ -1,24 +1,93 @@
 from functools import cache
 import asyncio
 from utils.context import Context
+from utils.swr_cache import SWRCache
+from utils.timer import Timer
 from .searcher import Searcher
+from .health import CircuitOpenError
 from pathlib import Path
 import json
+import os
+import unicodedata
+
+_SEARCHER_CONFIG_PATH = Path(__file__).parent / "searcher.json"
 
 
 def searcher_config():
-    with open(Path(__file__).parent / "searcher.json", "r") as f:
+    with open(_SEARCHER_CONFIG_PATH, "r") as f:
         return json.load(f)
 
 
+class SearcherRegistry:
+    def __init__(self):
+        self.configs = {}
+        self.searchers = {}
+        self.mtime = None
+        self.load()
+
+    def load(self):
+        initial = self.mtime is None
+        self.mtime = os.stat(_SEARCHER_CONFIG_PATH).st_mtime
+        configs = {config["key"]: config for config in searcher_config()[
+            "searchers"] if config["enable"]}
+        searchers = {}
+        changed = []
+        for key, config in configs.items():
+            old = self.searchers.get(key)
+            if old is not None and self.configs[key] == config:
+                searchers[key] = old
+                continue
+            try:
+                searchers[key] = Searcher(config)
+            except Exception as e:
+                if initial:
+                    raise
+                if old is None:
+                    Context.error(f"build searcher {key} error, skip it: {e!r}")
+                    continue
+                searchers[key] = old
+                configs[key] = self.configs[key]
+                Context.error(
+                    f"rebuild searcher {key} error, keep old one: {e!r}")
+                continue
+            if old is not None:
+                searchers[key].health = old.health
+            changed.append(key)
+        changed += [key for key in self.searchers if key not in searchers]
+        self.searchers = searchers
+        self.configs = configs
+        return changed
+
+    def reload_if_changed(self):
+        if os.stat(_SEARCHER_CONFIG_PATH).st_mtime == self.mtime:
+            return []
+        return self.load()
+
+
 @cache
+def searcher_registry():
+    return SearcherRegistry()
+
+
 def searcher_list():
-    return [Searcher(config) for config in searcher_config()["searchers"] if config["enable"]]
+    return list(searcher_registry().searchers.values())
 
 
-@cache
 def searcher_dict():
-    return {i.key: i for i in searcher_list()}
+    return searcher_registry().searchers
+
+
+@cache
+def search_cache():
+    config = Context.current.config.search
+    return SWRCache(
+        config.cache_ttl.total_seconds(),
+        config.cache_stale_ttl.total_seconds(),
+        config.cache_size)
+
+
+def normalize_keyword(keyword):
+    return " ".join(unicodedata.normalize("NFKC", keyword).lower().split())
 
 
 class SearchFunctor:
@@ -27,14 +96,41 @@ class SearchFunctor:
 
     async def __call__(self, searcher):
         with Context.handle_error_context(f"search {self.keyword} on {searcher.key} error"):
-            return await searcher.search(self.keyword)
+            try:
+                return await search_cache().get(
+                    (searcher.key, normalize_keyword(self.keyword)),
+                    lambda: searcher.search(self.keyword))
+            except CircuitOpenError:
+                return []
         return []
 
 
+class SearcherWatcher:
+    def __init__(self, interval):
+        self.timer = Timer(self.check, interval)
+
+    async def start(self):
+        await self.timer.start()
+
+    async def stop(self):
+        await self.timer.stop()
+
+    async def check(self):
+        with Context.handle_error_context("reload searcher.json error"):
+            changed = searcher_registry().reload_if_changed()
+            if changed:
+                Context.info(f"searchers reloaded: {changed}")
+                search_cache().invalidate(lambda key: key[0] in changed)
+
+
 class Searchers:
-    def __init__(self):
-        self.searcher_list = searcher_list()
-        self.searcher_dict = searcher_dict()
+    @property
+    def searcher_list(self):
+        return searcher_list()
+
+    @property
+    def searcher_dict(self):
+        return searcher_dict()
 
     async def search(self, keyword):
         results = await asyncio.gather(
@@ -45,6 +141,24 @@ class Searchers:
         )
         return sum(results, [])
 
+    async def search_iter(self, keyword, timeout):
+        functor = SearchFunctor(keyword)
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(functor(searcher), timeout)): searcher
+            for searcher in self.searcher_list}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        yield tasks[task], task.result(), False
+                    except asyncio.TimeoutError:
+                        yield tasks[task], [], True
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def update(self, source):
         return await self.searcher_dict[source.source_key].update(source)
 
@@ -1,10 +1,12 @@
 from utils.baidu import baidu_search
+from utils.parallel_runner import bounded_gather
 import re
 
 
 class BaiduSubjectSearcher:
-    def __init__(self, search_template, filter=".*", match_point=0.6, **kwargs):
+    def __init__(self, search_template, filter=".*", match_point=0.6, concurrent=4, **kwargs):
         self.search_template = search_template
+        self.concurrent = concurrent
         self.filter = re.compile(filter)
         self.match_point = match_point
 
@@ -18,6 +20,6 @@ class BaiduSubjectSearcher:
     async def search(self, keyword: str):
         rst = await baidu_search(self.search_template.format(keyword=keyword))
         rst = [i for i in rst if self.filter.match(i)]
-        rst = [await self.parse(i) for i in rst]
+        rst = await bounded_gather([self.parse(i) for i in rst], self.concurrent)
         rst = [i for i in rst if self.match(keyword, i.name)]
         return rst
@@ -1,22 +1,28 @@
 from .baidu import BaiduSubjectSearcher
-from utils.beautiful import request, to_text
+from utils.beautiful import request_text, to_text
+from utils.html_parser import parse_html, select_one, compile_selector
 from schema.searcher import Subject
 import urllib
-import asyncio
 
 
 class BaiduASubjectSearcher(BaiduSubjectSearcher):
-    def __init__(self, url_selector, name_selector, cover_selector, **kwargs):
+    def __init__(self, url_selector, name_selector, cover_selector, parser="lxml", **kwargs):
         super().__init__(**kwargs)
         self.url_selector = url_selector
         self.name_selector = name_selector
         self.cover_selector = cover_selector
+        self.parser = parser
+        for selector in [url_selector, name_selector, cover_selector]:
+            compile_selector(selector)
 
     async def parse(self, src: str):
-        soup = await request(src)
-        url = soup.select_one(self.url_selector).get("href")
-        name = to_text(soup.select_one(self.name_selector))
-        cover = soup.select_one(self.cover_selector).get("src")
+        text = await request_text(src)
+        return await parse_html(self.parse_soup, src, text, self.parser)
+
+    def parse_soup(self, src, soup):
+        url = select_one(soup, self.url_selector).get("href")
+        name = to_text(select_one(soup, self.name_selector))
+        cover = select_one(soup, self.cover_selector).get("src")
         return Subject(
             url=urllib.parse.urljoin(src, url),
             name=name,
@@ -1,16 +1,18 @@
 from schema.searcher import Subject
-from utils.beautiful import request, to_text
+from utils.beautiful import request_text
+from utils.html_parser import parse_html
 import urllib
 
 
 class WebSubjectSearcher:
-    def __init__(self, search_url, **kwargs):
+    def __init__(self, search_url, parser="lxml", **kwargs):
         self.search_url = search_url
+        self.parser = parser
 
     def request_url(self, query):
         return self.search_url.format(keyword=urllib.parse.quote(query))
 
     async def search(self, query):
         request_url = self.request_url(query)
-        soup = await request(request_url)
-        return self.parse(request_url, soup)
+        text = await request_text(request_url)
+        return await parse_html(self.parse, request_url, text, self.parser)
@@ -1,6 +1,7 @@
 from .web import WebSubjectSearcher
 from schema.searcher import Subject
 from utils.beautiful import to_text
+from utils.html_parser import select, compile_selector
 import urllib
 
 
@@ -11,11 +12,13 @@ class WebASubjectSearcher(WebSubjectSearcher):
         self.a = a
         self.cover = cover
         self.cover_attr = cover_attr
+        for selector in [token, a, cover]:
+            compile_selector(selector)
 
     def parse(self, src, soup):
-        tokens = soup.select(self.token)
-        a_s = soup.select(self.a)
-        covers = soup.select(self.cover)
+        tokens = select(soup, self.token)
+        a_s = select(soup, self.a)
+        covers = select(soup, self.cover)
 
         if len(tokens) != len(a_s):
             raise RuntimeError(
@@ -1,4 +1,6 @@
 from aiohttp import web
+from collections import OrderedDict
+import hashlib
 
 
 def api(func):
@@ -11,13 +13,100 @@ def mock(func):
     return func
 
 
-def _wrap(func):
+def stream(func):
+    func.__stream__ = True
+    return func
+
+
+def idempotent(func):
+    func.__idempotent__ = True
+    return func
+
+
+def cached(version):
+    def decorator(func):
+        func.__cached__ = version
+        func.__idempotent__ = True
+        return func
+    return decorator
+
+
+class ResponseCache:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.items = OrderedDict()
+
+    def get(self, key, version):
+        item = self.items.get(key)
+        if item is None or item[0] != version:
+            return None
+        self.items.move_to_end(key)
+        return item[1], item[2]
+
+    def put(self, key, version, body):
+        etag = _etag(body)
+        self.items[key] = (version, body, etag)
+        self.items.move_to_end(key)
+        while len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+        return body, etag
+
+
+def _etag(body):
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _etag_match(request, etag):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is None:
+        return False
+    tags = [i.strip().removeprefix("W/") for i in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _cached_response(request, body, etag):
+    if _etag_match(request, etag):
+        return web.Response(status=304, headers={"ETag": etag})
+    return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+
+def _wrap(func, cache=None):
     request_type = func.__annotations__["request"]
+    version = getattr(func, "__cached__", None)
+    idempotent = getattr(func, "__idempotent__", False)
 
     async def wrapper(request):
         text = await request.text()
-        request = request_type.model_validate_json(text)
-        return web.json_response(text=(await func(request)).model_dump_json())
+        body = request_type.model_validate_json(text)
+        if version is None or cache is None:
+            response = (await func(body)).model_dump_json()
+            if not idempotent:
+                return web.json_response(text=response)
+            response = response.encode()
+            return _cached_response(request, response, _etag(response))
+        key = (func.__name__, body.model_dump_json())
+        current_version = version(func.__self__, body)
+        item = cache.get(key, current_version)
+        if item is None:
+            response = (await func(body)).model_dump_json().encode()
+            item = cache.put(key, current_version, response)
+        return _cached_response(request, *item)
+    return wrapper
+
+
+def _wrap_stream(func):
+    request_type = func.__annotations__["request"]
+
+    async def wrapper(request):
+        text = await request.text()
+        body = request_type.model_validate_json(text)
+        response = web.StreamResponse(
+            headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        async for chunk in func(body):
+            await response.write(chunk.model_dump_json().encode() + b"\n")
+        await response.write_eof()
+        return response
     return wrapper
 
 
@@ -25,6 +114,7 @@ def create_routes(api_handler, mock=False):
     routes = []
     api = {}
     mock_api = {}
+    cache = ResponseCache()
     for name, func in api_handler.__class__.__dict__.items():
         if hasattr(func, "__api__"):
             api[name] = getattr(api_handler, name)
@@ -34,7 +124,10 @@ def create_routes(api_handler, mock=False):
         if mock and name in mock_api:
             routes.append(
                 web.post(f"/api/{name}", _wrap(mock_api[name])))
+        elif hasattr(func, "__stream__"):
+            routes.append(
+                web.post(f"/api/{name}", _wrap_stream(func)))
         else:
             routes.append(
-                web.post(f"/api/{name}", _wrap(func)))
+                web.post(f"/api/{name}", _wrap(func, cache)))
     return routes
@@ -13,10 +13,30 @@ class AudioHandler:
             path = path[:-4] + ".mp4"
         else:
             return web.Response(status=404)
-        if os.path.exists(path):
-            return web.FileResponse(await self.tracker.get_audio(path))
-        else:
+        if not os.path.exists(path):
             return web.Response(status=404)
+        cached = self.tracker.cached_audio(path)
+        if cached is not None:
+            return web.FileResponse(cached)
+        if not self.tracker.config.audio.stream:
+            return web.FileResponse(await self.tracker.get_audio(path))
+        response = web.StreamResponse(headers={"Content-Type": "audio/mp4"})
+
+        async def write(chunk):
+            if not response.prepared:
+                await response.prepare(request)
+            await response.write(chunk)
+        try:
+            audio = await self.tracker.stream_audio(path, write)
+        except ConnectionError:
+            return response
+        if not response.prepared:
+            return web.FileResponse(audio)
+        try:
+            await response.write_eof()
+        except ConnectionError:
+            pass
+        return response
 
 
 def audio_routes(web_path, path, tracker):
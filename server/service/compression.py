@@ -0,0 +1,79 @@
+from aiohttp import web
+import asyncio
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+_BROTLI_QUALITY = 5
+
+
+def _accept_encodings(request):
+    encodings = {}
+    for item in request.headers.get("Accept-Encoding", "").lower().split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            encodings[name] = q
+    return encodings
+
+
+def _negotiate(request):
+    encodings = _accept_encodings(request)
+    candidates = ["gzip", "deflate"]
+    if brotli is not None:
+        candidates = ["br"] + candidates
+    for name in candidates:
+        if encodings.get(name, 0) > 0:
+            return name
+    return None
+
+
+def _compressible(response, min_size):
+    if type(response) is not web.Response or response.status != 200:
+        return False
+    if "Content-Encoding" in response.headers or response.body is None:
+        return False
+    if not isinstance(response.body, bytes) or len(response.body) < min_size:
+        return False
+    return response.content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+def _weak_etag(response):
+    etag = response.headers.get("ETag")
+    if etag is not None and not etag.startswith("W/"):
+        response.headers["ETag"] = "W/" + etag
+
+
+def compression_middleware(min_size):
+    @web.middleware
+    async def middleware(request, handler):
+        response = await handler(request)
+        if not _compressible(response, min_size):
+            return response
+        response.headers.add("Vary", "Accept-Encoding")
+        encoding = _negotiate(request)
+        if encoding is None:
+            return response
+        _weak_etag(response)
+        if encoding == "br":
+            loop = asyncio.get_running_loop()
+            response.body = await loop.run_in_executor(
+                None, lambda body=response.body: brotli.compress(body, quality=_BROTLI_QUALITY))
+            response.headers["Content-Encoding"] = "br"
+        else:
+            response.enable_compression(web.ContentCoding(encoding))
+        return response
+    return middleware
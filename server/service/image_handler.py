@@ -0,0 +1,33 @@
+from aiohttp import web
+from utils.context import Context
+from urllib.parse import urlparse
+
+_CACHE_CONTROL = "public, max-age=604800"
+
+
+class ImageHandler:
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    async def __call__(self, request):
+        url = request.query.get("url", "")
+        try:
+            width = int(request.query.get("w", "0"))
+        except ValueError:
+            return web.Response(status=400)
+        if urlparse(url).scheme not in ("http", "https"):
+            return web.Response(status=400)
+        try:
+            path = await self.tracker.get_image(url, width)
+        except Exception as e:
+            Context.warning(f"image proxy {url} error: {e}")
+            return web.Response(status=502)
+        return web.FileResponse(path, headers={
+            "Cache-Control": _CACHE_CONTROL,
+            "Content-Type": "image/jpeg"})
+
+
+def image_routes(web_path, tracker):
+    return [
+        web.get(web_path, ImageHandler(tracker)),
+    ]
@@ -0,0 +1,28 @@
+import os
+import re
+from aiohttp import web
+
+_THUMBNAIL_NAME = re.compile(r"^[0-9]+/[A-Za-z0-9_]+-[0-9a-f]+-[0-9]+\.jpg$")
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ThumbnailHandler:
+    def __init__(self, path):
+        self.path = path
+
+    async def __call__(self, request):
+        name = request.match_info['path']
+        if not _THUMBNAIL_NAME.match(name):
+            return web.Response(status=404)
+        path = os.path.join(self.path, name)
+        if not os.path.exists(path):
+            return web.Response(status=404)
+        return web.FileResponse(path, headers={"Cache-Control": _CACHE_CONTROL})
+
+
+def thumbnail_routes(web_path, path):
+    if not web_path.endswith('/'):
+        web_path += '/'
+    return [
+        web.get(web_path + 'by-id/{path:.*}', ThumbnailHandler(os.path.join(path, "by-id"))),
+    ]
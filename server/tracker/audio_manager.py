@@ -1,16 +1,70 @@
 from utils.file_cache import FileCache
-from utils.run_cmd import run_cmd
+from utils.run_cmd import run_cmd, low_priority_cmd
+from .path_manager import PathManager
+import asyncio
+import os
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_FRAGMENT_US = 1000000
+_STREAM_POLL_INTERVAL = 0.2
 
 
 class AudioManager:
-    def __init__(self):
-        self.file_cache = FileCache("m4a")
+    def __init__(self, config):
+        self.config = config.audio
+        self.file_cache = FileCache(
+            PathManager(config).cache_dir("audio"), "m4a",
+            self.config.cache_size_mb * 1024 * 1024)
+
+    async def create_audio_file(self, src, dst, low_priority=False):
+        cmd = low_priority_cmd() if low_priority else []
+        await run_cmd(*cmd, "ffmpeg", "-y", "-i", src, "-vn", "-c:a", "copy",
+                      "-f", "mp4", "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+                      "-frag_duration", str(_STREAM_FRAGMENT_US), dst)
+
+    def cache_key(self, src):
+        stat = os.stat(src)
+        return f"{src}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def get(self, src, low_priority=False):
+        return self.file_cache.get(self.cache_key(src), lambda f: self.create_audio_file(src, f, low_priority))
+
+    def cached(self, src):
+        try:
+            return self.file_cache.lookup(self.cache_key(src))
+        except FileNotFoundError:
+            return None
 
-    async def create_audio_file(self, src, dst):
-        await run_cmd("ffmpeg", "-i", src, "-vn", "-c:a", "copy", dst)
+    async def tail(self, tmp, task, write):
+        while not os.path.exists(tmp):
+            if task.done():
+                return
+            await asyncio.sleep(_STREAM_POLL_INTERVAL)
+        try:
+            f = open(tmp, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            while True:
+                done = task.done()
+                chunk = f.read(_STREAM_CHUNK_SIZE)
+                if chunk:
+                    await write(chunk)
+                elif done:
+                    return
+                else:
+                    await asyncio.sleep(_STREAM_POLL_INTERVAL)
 
-    def get(self, src):
-        return self.file_cache.get(src, lambda f: self.create_audio_file(src, f))
+    async def stream(self, src, write):
+        key = self.cache_key(src)
+        task = asyncio.ensure_future(self.file_cache.get(
+            key, lambda f: self.create_audio_file(src, f)))
+        try:
+            await self.tail(self.file_cache.tmp_file(key), task, write)
+        except BaseException:
+            task.cancel()
+            raise
+        return await task
 
     def start(self):
         self.file_cache.start()
@@ -0,0 +1,58 @@
+from schema.config import Config
+from schema.db import LocalStore
+from .db_manager import DBManager
+from .path_manager import PathManager
+from .audio_manager import AudioManager
+from utils.context import Context
+import asyncio
+
+
+class AudioPrefetcher:
+    def __init__(self, config: Config, db: DBManager, audio: AudioManager):
+        self.config = config.audio
+        self.db = db
+        self.audio = audio
+        self.path = PathManager(config)
+        self.queue = asyncio.Queue()
+        self.queued = set()
+        self.workers = []
+
+    def candidates(self, tv):
+        if tv.tag not in self.config.prefetch_tags:
+            return []
+        start = tv.watch.watched_episode
+        episodes = tv.local.episodes[start:start + self.config.prefetch_episodes]
+        return [self.path.episode(tv, start + i)
+                for i, e in enumerate(episodes)
+                if e.download == LocalStore.DownloadStatus.SUCCESS]
+
+    def submit(self, tv_id):
+        if not self.config.prefetch:
+            return
+        for src in self.candidates(self.db.tv(tv_id)):
+            if src in self.queued or self.audio.cached(src) is not None:
+                continue
+            self.queued.add(src)
+            self.queue.put_nowait(src)
+
+    async def work(self):
+        while True:
+            src = await self.queue.get()
+            with Context.handle_error_context(f"prefetch audio {src} error"):
+                Context.info(f"prefetch audio: {src}")
+                await self.audio.get(src, low_priority=True)
+            self.queued.discard(src)
+
+    async def start(self):
+        if not self.config.prefetch:
+            return
+        self.workers = [asyncio.create_task(self.work())
+                        for _ in range(self.config.prefetch_concurrent)]
+        for tv_id in self.db.db().tv:
+            self.submit(tv_id)
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
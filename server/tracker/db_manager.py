@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from pydantic import BaseModel
 from utils.timer import Timer
-from schema.db import DB, TV, ErrorDB, AdBlockDB
+from schema.db import DB, TV, AdBlockDB, ScheduleDB, RecipeDB
 from utils.path import atomic_file_write
 from .path_manager import PathManager
 import os
@@ -18,6 +18,7 @@ class DBManagerImpl:
     def __init__(self, save_interval):
         self.rows = {}
         self.dirty = set()
+        self.row_versions = {}
         self._version = str(uuid.uuid4())
         self.save_timer = Timer(self.async_save, save_interval)
 
@@ -32,6 +33,9 @@ class DBManagerImpl:
     def version(self):
         return self._version
 
+    def row_version(self, key):
+        return self.row_versions.get(key, 0)
+
     async def async_save(self):
         self.save()
 
@@ -51,8 +55,13 @@ class DBManagerImpl:
         if key in self.dirty:
             self.dirty.remove(key)
 
-    def mark_dirty(self, key):
+    def bump_version(self):
         self._version = str(uuid.uuid4())
+
+    def mark_dirty(self, key, bump_version=True):
+        if bump_version:
+            self._version = str(uuid.uuid4())
+        self.row_versions[key] = self.row_versions.get(key, 0) + 1
         self.dirty.add(key)
 
     def save(self):
@@ -73,16 +82,24 @@ class DBManager:
             self.impl.load_row("db", self.path.db_json(), DB)
         else:
             self.impl.new_row("db", self.path.db_json(), DB())
-        if os.path.exists(self.path.error_json()):
-            self.impl.load_row("error", self.path.error_json(), ErrorDB)
-        else:
-            self.impl.new_row("error", self.path.error_json(), ErrorDB())
         if os.path.exists(self.path.ad_block_json()):
             self.impl.load_row(
                 "ad_block", self.path.ad_block_json(), AdBlockDB)
         else:
             self.impl.new_row(
                 "ad_block", self.path.ad_block_json(), AdBlockDB())
+        if os.path.exists(self.path.schedule_json()):
+            self.impl.load_row(
+                "schedule", self.path.schedule_json(), ScheduleDB)
+        else:
+            self.impl.new_row(
+                "schedule", self.path.schedule_json(), ScheduleDB())
+        if os.path.exists(self.path.recipe_json()):
+            self.impl.load_row(
+                "recipe", self.path.recipe_json(), RecipeDB)
+        else:
+            self.impl.new_row(
+                "recipe", self.path.recipe_json(), RecipeDB())
 
         for tv_id, tv_name in self.db().tv.items():
             self.impl.load_row(tv_id, self.path.tv_json(tv_id), TV)
@@ -100,9 +117,15 @@ class DBManager:
     def tv(self, tv_id):
         return self.impl.get_row(tv_id)
 
+    def tv_version(self, tv_id):
+        return self.impl.row_version(tv_id)
+
     def tv_dirty(self, tv):
         self.impl.mark_dirty(tv.id)
 
+    def tv_meta_dirty(self, tv):
+        self.impl.mark_dirty(tv.id, bump_version=False)
+
     def tv_new(self, tv):
         self.impl.new_row(tv.id, self.path.tv_json(tv.id), tv)
 
@@ -118,11 +141,14 @@ class DBManager:
     def db_dirty(self):
         self.impl.mark_dirty("db")
 
-    def error(self):
-        return self.impl.get_row("error")
-
     def error_dirty(self):
-        self.impl.mark_dirty("error")
+        self.impl.bump_version()
+
+    def schedule(self):
+        return self.impl.get_row("schedule")
+
+    def schedule_dirty(self):
+        self.impl.mark_dirty("schedule", bump_version=False)
 
     def ad_block(self):
         return self.impl.get_row("ad_block")
@@ -130,5 +156,11 @@ class DBManager:
     def ad_block_dirty(self):
         self.impl.mark_dirty("ad_block")
 
+    def recipe(self):
+        return self.impl.get_row("recipe")
+
+    def recipe_dirty(self):
+        self.impl.mark_dirty("recipe", bump_version=False)
+
     def save(self):
         self.impl.save()
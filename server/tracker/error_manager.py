@@ -1,34 +1,149 @@
 from schema.db import ErrorDB
 from .db_manager import DBManager
+from .path_manager import PathManager
 from datetime import datetime
+from collections import OrderedDict
+from itertools import islice
+from utils.path import atomic_file_write
 from schema.config import Config
+import json
+import os
+
+
+class ErrorLog:
+    def __init__(self, path: str, max_count: int):
+        self.path = path
+        self.max_count = max_count
+        self.errors = OrderedDict()
+        self.index = {}
+        self.last_id = 0
+        self.lines = 0
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "last_id" in record:
+                    self.last_id = max(self.last_id, record["last_id"])
+                elif "add" in record:
+                    self._add(ErrorDB.Error.model_validate(record["add"]))
+                elif "hit" in record:
+                    self._hit(record["hit"]["id"], record["hit"]["count"],
+                              datetime.fromisoformat(record["hit"]["timestamp"]))
+                elif "remove" in record:
+                    self._remove(record["remove"])
+                self.lines += 1
+
+    def next_id(self):
+        return self.last_id + 1
+
+    def count(self):
+        return len(self.errors)
+
+    def page(self, offset: int = 0, limit: int = 0):
+        errors = reversed(self.errors.values())
+        return list(islice(errors, offset, offset + limit if limit > 0 else None))
+
+    def add(self, id: int, title: str, error: str):
+        now = datetime.now()
+        key = (title, error)
+        if key in self.index:
+            item = self.index[key]
+            self._hit(item.id, item.count + 1, now)
+            self._append({"hit": {"id": item.id, "count": item.count,
+                                  "timestamp": now.isoformat()}})
+            return False
+        item = ErrorDB.Error(id=id, timestamp=now, title=title, error=error)
+        self._add(item)
+        self._append({"add": item.model_dump(mode="json")})
+        return True
+
+    def remove(self, ids: list[int]):
+        ids = [i for i in ids if i in self.errors]
+        if ids:
+            self._remove(ids)
+            self._append({"remove": ids})
+
+    def import_errors(self, errors: list[ErrorDB.Error]):
+        for item in errors:
+            self._add(item)
+        self.compact()
+
+    def compact(self):
+        content = json.dumps({"last_id": self.last_id}) + "\n"
+        content += "".join(json.dumps({"add": item.model_dump(mode="json")}) + "\n"
+                          for item in self.errors.values())
+        atomic_file_write(self.path, content)
+        self.lines = len(self.errors) + 1
+
+    def _add(self, item: ErrorDB.Error):
+        self.errors[item.id] = item
+        self.last_id = max(self.last_id, item.id)
+        self.index[(item.title, item.error)] = item
+        while len(self.errors) > self.max_count:
+            _, old = self.errors.popitem(last=False)
+            del self.index[(old.title, old.error)]
+
+    def _hit(self, id: int, count: int, timestamp: datetime):
+        item = self.errors.get(id)
+        if item is None:
+            return
+        item.count = count
+        item.timestamp = timestamp
+        self.errors.move_to_end(id)
+
+    def _remove(self, ids: list[int]):
+        for id in ids:
+            item = self.errors.pop(id, None)
+            if item is not None:
+                del self.index[(item.title, item.error)]
+
+    def _append(self, record):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        self.lines += 1
+        if self.lines > 2 * self.max_count:
+            self.compact()
 
 
 class ErrorManager:
     def __init__(self, config: Config, db: DBManager):
         self.config = config
         self.db = db
+        self.path = PathManager(config)
+        self.errors = ErrorLog(
+            self.path.error_log("errors"), config.error.max_error_count)
+        self.critical_errors = ErrorLog(
+            self.path.error_log("critical_errors"), config.error.max_error_count)
+        self.next_id = 1
+
+    def start(self):
+        self.errors.load()
+        self.critical_errors.load()
+        if os.path.exists(self.path.error_json()):
+            error_db = ErrorDB.parse_file(self.path.error_json())
+            self.errors.import_errors(error_db.errors)
+            self.critical_errors.import_errors(error_db.critical_errors)
+            os.rename(self.path.error_json(), self.path.error_json() + ".bak")
+        self.next_id = max(self.errors.next_id(),
+                           self.critical_errors.next_id())
+
+    def _handle(self, log: ErrorLog, title: str, error: str):
+        if log.add(self.next_id, title, error):
+            self.next_id += 1
+            self.db.error_dirty()
 
     def handle_error(self, title: str, error: str):
-        error_db = self.db.error()
-        error_db.errors.append(ErrorDB.Error(
-            id=error_db.next_id,
-            timestamp=datetime.now(),
-            title=title,
-            error=error))
-        error_db.next_id += 1
-        if len(error_db.errors) > self.config.error.max_error_count:
-            error_db.errors.pop(0)
-        self.db.error_dirty()
+        self._handle(self.errors, title, error)
 
     def handle_critical_error(self, title: str, error: str):
-        error_db = self.db.error()
-        error_db.critical_errors.append(ErrorDB.Error(
-            id=error_db.next_id,
-            timestamp=datetime.now(),
-            title=title,
-            error=error))
-        error_db.next_id += 1
-        if len(error_db.critical_errors) > self.config.error.max_error_count:
-            error_db.critical_errors.pop(0)
+        self._handle(self.critical_errors, title, error)
+
+    def clear(self, ids: list[int]):
+        self.errors.remove(ids)
+        self.critical_errors.remove(ids)
         self.db.error_dirty()
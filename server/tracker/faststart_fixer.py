@@ -0,0 +1,65 @@
+from schema.config import Config
+from schema.db import LocalStore
+from .db_manager import DBManager
+from .path_manager import PathManager
+from downloader.faststart import ensure_faststart, is_faststart_tmp
+from utils.context import Context
+from utils.timer import Timer
+import os
+
+
+class FaststartFixer:
+    _MAX_FAILURES = 3
+
+    def __init__(self, config: Config, db: DBManager):
+        self.config = config.download
+        self.db = db
+        self.path = PathManager(config)
+        self.timer = Timer(
+            self.fix, self.config.faststart_interval.total_seconds())
+
+    def clean_tmp(self):
+        for tv_id in list(self.db.db().tv):
+            directory = self.path.tv_dir_by_id(tv_id)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if is_faststart_tmp(name):
+                    Context.info(f"remove faststart leftover: {name}")
+                    os.remove(os.path.join(directory, name))
+
+    async def start(self):
+        with Context.handle_error_context("clean faststart leftovers error"):
+            self.clean_tmp()
+        if self.config.faststart_batch > 0:
+            await self.timer.start()
+
+    async def stop(self):
+        if self.config.faststart_batch > 0:
+            await self.timer.stop()
+
+    def pending(self):
+        for tv_id in list(self.db.db().tv):
+            tv = self.db.tv(tv_id)
+            for episode_id, episode in enumerate(tv.local.episodes):
+                if episode.download != LocalStore.DownloadStatus.SUCCESS or episode.faststart:
+                    continue
+                if episode.faststart_failures >= FaststartFixer._MAX_FAILURES:
+                    continue
+                path = self.path.episode(tv, episode_id)
+                if os.path.exists(path):
+                    yield tv, episode_id, path
+
+    async def fix(self):
+        for tv, episode_id, path in list(self.pending())[:self.config.faststart_batch]:
+            with Context.handle_error_context(f"faststart {path} error"):
+                episode = tv.local.episodes[episode_id]
+                try:
+                    if await ensure_faststart(path, low_priority=True):
+                        Context.info(f"faststart fixed: {path}")
+                except Exception:
+                    episode.faststart_failures += 1
+                    self.db.tv_meta_dirty(tv)
+                    raise
+                episode.faststart = True
+                self.db.tv_meta_dirty(tv)
@@ -0,0 +1,47 @@
+from utils.file_cache import FileCache
+from utils.beautiful import HEADERS
+from utils import http_client, thumbnail
+from .path_manager import PathManager
+from urllib.parse import urlparse
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ImageProxy:
+    def __init__(self, config):
+        self.config = config
+        self.max_bytes = config.image_proxy.max_size_mb * 1024 * 1024
+        self.file_cache = FileCache(
+            PathManager(config).cache_dir("image"), "jpg",
+            config.image_proxy.cache_size_mb * 1024 * 1024)
+
+    def start(self):
+        self.file_cache.start()
+
+    def close(self):
+        self.file_cache.close()
+
+    async def fetch(self, url, width, dst):
+        parsed = urlparse(url)
+        headers = dict(HEADERS)
+        headers["Referer"] = f"{parsed.scheme}://{parsed.netloc}/"
+        async with http_client.get(url, headers=headers) as resp:
+            resp.raise_for_status()
+            if resp.content_length is not None and resp.content_length > self.max_bytes:
+                raise ValueError(f"image too large: {url}")
+            data = bytearray()
+            async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+                data += chunk
+                if len(data) > self.max_bytes:
+                    raise ValueError(f"image too large: {url}")
+        image = await thumbnail.resize(bytes(data), width)
+        with open(dst, "wb") as f:
+            f.write(image)
+
+    async def get(self, url, width=0):
+        if urlparse(url).scheme not in ("http", "https"):
+            raise ValueError(f"unsupported image url: {url}")
+        sizes = self.config.thumbnail.sizes
+        width = thumbnail.pick_size(sizes, width or max(sizes))
+        return await self.file_cache.get(
+            f"{width}:{url}", lambda f: self.fetch(url, width, f))
@@ -4,10 +4,13 @@ import os
 from schema.config import Config
 from schema.db import TV, LocalStore, Source
 from utils.context import Context
+from utils import http_client, thumbnail
 from .db_manager import DBManager
+from .audio_prefetcher import AudioPrefetcher
 from downloader.download_manager import DownloadManager
 from datetime import datetime
 import shutil
+import asyncio
 
 
 def _get_ext(url: str):
@@ -27,11 +30,12 @@ def _get_name(name, other):
 
 
 class LocalManager:
-    def __init__(self, config: Config, db: DBManager, downloader: DownloadManager):
+    def __init__(self, config: Config, db: DBManager, downloader: DownloadManager, audio_prefetcher: AudioPrefetcher = None):
         self.config = config
         self.db = db
         self.path = PathManager(config)
         self.downloader = downloader
+        self.audio_prefetcher = audio_prefetcher
 
     async def add_tv(self, name: str, source: Source, tag: str):
         db = self.db.db()
@@ -78,13 +82,15 @@ class LocalManager:
     async def update(self, tv_id: int):
         tv = self.db.tv(tv_id)
         if tv.local.cover is None:
-            async with Context.client.get(tv.source.cover_url) as resp:
+            async with http_client.get(tv.source.cover_url) as resp:
                 resp.raise_for_status()
                 cover = await resp.read()
                 cover_fn = "cover" + _get_ext(tv.source.cover_url)
                 atomic_file_write(self.path.tv_file(tv, cover_fn), cover)
                 tv.local.cover = cover_fn
                 self.db.tv_dirty(tv)
+        with Context.handle_error_context(f"update thumbnails {tv.name} error"):
+            await self.update_thumbnails(tv)
         if len(tv.local.episodes) < len(tv.source.episodes):
             for episode_id in range(len(tv.local.episodes), len(tv.source.episodes)):
                 name = tv.source.episodes[episode_id].name
@@ -97,8 +103,24 @@ class LocalManager:
                 self.db.tv_dirty(tv)
                 self.submit_download(tv.id, episode_id)
 
+    async def update_thumbnails(self, tv: TV):
+        sizes = self.config.thumbnail.sizes
+        if tv.local.cover is None or set(tv.local.thumbnails) == set(sizes):
+            return
+        with open(self.path.tv_cover(tv), "rb") as f:
+            cover = f.read()
+        tv.local.thumbnails = await thumbnail.make_thumbnails(
+            cover, sizes, self.path.tv_dir(tv), "cover")
+        self.db.tv_dirty(tv)
+
+    async def update_all_thumbnails(self):
+        for tv_id in list(self.db.db().tv):
+            with Context.handle_error_context(f"update thumbnails {tv_id} error"):
+                await self.update_thumbnails(self.db.tv(tv_id))
+
     async def start(self):
         self.submit_download_tasks()
+        self.thumbnail_task = asyncio.create_task(self.update_all_thumbnails())
 
     def submit_download_tasks(self):
         for tv_id in self.db.db().tv:
@@ -114,6 +136,8 @@ class LocalManager:
         episode.download = LocalStore.DownloadStatus.SUCCESS
         tv.touch_time = datetime.now()
         self.db.tv_dirty(tv)
+        if self.audio_prefetcher is not None:
+            self.audio_prefetcher.submit(tv_id)
 
     def on_download_error(self, tv_id: int, episode_id: int, error: str):
         tv = self.db.tv(tv_id)
@@ -1,5 +1,6 @@
 from schema.config import Config
 from schema.db import TV
+from utils import thumbnail
 import os
 
 
@@ -21,9 +22,21 @@ class PathManager:
     def error_json(self):
         return os.path.join(self.local_path, "error.json")
 
+    def error_log(self, kind: str):
+        return os.path.join(self.local_path, f"{kind}.jsonl")
+
+    def schedule_json(self):
+        return os.path.join(self.local_path, "schedule.json")
+
     def ad_block_json(self):
         return os.path.join(self.local_path, "ad_block.json")
 
+    def cache_dir(self, kind: str):
+        return os.path.join(self.local_path, "cache", kind)
+
+    def recipe_json(self):
+        return os.path.join(self.local_path, "recipe.json")
+
     def tv_dir_by_id(self, tv_id: int):
         return os.path.join(self.local_path, "by-id", str(tv_id))
 
@@ -68,6 +81,15 @@ class PathManager:
     def cover_url(self, tv: TV, by: str = "id"):
         return self.tv_url(tv, tv.local.cover, by)
 
+    def thumbnail_url(self, tv: TV, filename: str):
+        return f"/thumbnail/by-id/{tv.id}/{filename}"
+
+    def icon_url(self, tv: TV, size: int = 0):
+        thumbnail_size = thumbnail.pick_size(list(tv.local.thumbnails), size)
+        if size <= 0 or thumbnail_size is None:
+            return self.cover_url(tv)
+        return self.thumbnail_url(tv, tv.local.thumbnails[thumbnail_size])
+
     def episode(self, tv: TV, episode_idx: int, by: str = "id"):
         return self.tv_file(tv, tv.local.episodes[episode_idx].filename, by)
 
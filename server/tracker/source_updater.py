@@ -1,12 +1,14 @@
 from schema.config import Config
 from .db_manager import DBManager
 from .local_manager import LocalManager
+from .update_scheduler import UpdateScheduler
 from utils.timer import Timer
-import asyncio
+from utils.sweep_scheduler import SweepScheduler
 from searcher.searchers import Searchers
+from searcher.health import CircuitOpenError
 from utils.context import Context
+from schema.db import UpdateSchedule
 from datetime import datetime
-from collections import defaultdict
 
 
 class SourceUpdater:
@@ -15,9 +17,13 @@ class SourceUpdater:
         self.db = db
         self.local = local
         self.timer = Timer(
-            self.update, self.config.source_updater.update_interval.total_seconds())
+            self.update, self.config.source_updater.check_interval.total_seconds())
         self.searchers = Searchers()
-        self.error_times = defaultdict(int)
+        self.update_scheduler = UpdateScheduler(self.config.source_updater)
+        self.scheduler = SweepScheduler(
+            self.config.source_updater.concurrent,
+            self.config.source_updater.searcher_concurrent,
+            self.config.source_updater.check_interval.total_seconds() * self.config.source_updater.spread)
 
     async def start(self):
         await self.timer.start()
@@ -25,11 +31,29 @@ class SourceUpdater:
     async def stop(self):
         await self.timer.stop()
 
+    def schedule(self, tv_id):
+        return self.db.schedule().tv.setdefault(tv_id, UpdateSchedule())
+
+    def reschedule(self, tv_id, updated=False, error=False):
+        self.update_scheduler.reschedule(
+            self.db.tv(tv_id), self.schedule(tv_id), datetime.now(), updated, error)
+        self.db.schedule_dirty()
+
+    def defer(self, tv_id):
+        self.update_scheduler.defer(
+            self.db.tv(tv_id), self.schedule(tv_id), datetime.now())
+        self.db.schedule_dirty()
+
     async def update(self):
+        now = datetime.now()
         tv_list = self.db.db().tv.keys()
         tv_list = [
-            tv_id for tv_id in tv_list if self.db.tv(tv_id).source.tracking]
-        await asyncio.gather(*[self.update_tv(tv_id) for tv_id in tv_list])
+            tv_id for tv_id in tv_list if self.db.tv(tv_id).source.tracking
+            and self.update_scheduler.due(self.schedule(tv_id), now)]
+        await self.scheduler.run([
+            (self.db.tv(tv_id).source.source_key,
+             lambda tv_id=tv_id: self.update_tv(tv_id))
+            for tv_id in tv_list])
 
     async def update_tv(self, tv_id):
         tv_name = ""
@@ -42,7 +66,8 @@ class SourceUpdater:
                 source = self.db.tv(tv_id).source
                 new_source = await self.searchers.update(source)
                 tv = self.db.tv(tv_id)
-                if len(new_source.episodes) > len(source.episodes):
+                updated = len(new_source.episodes) > len(source.episodes)
+                if updated:
                     tv.source = new_source
                     tv.source.latest_update = datetime.now()
                     self.db.tv_dirty(tv)
@@ -55,8 +80,10 @@ class SourceUpdater:
                         Context.info(f"stop tracking {tv.name}, timeout")
                         tv.source.tracking = False
                         self.db.tv_dirty(tv)
-                self.error_times[tv_id] = 0
+                self.reschedule(tv_id, updated=updated)
+            except CircuitOpenError:
+                self.defer(tv_id)
             except:
-                self.error_times[tv_id] += 1
-                if self.error_times[tv_id] >= self.config.source_updater.max_error_times:
+                self.reschedule(tv_id, error=True)
+                if self.schedule(tv_id).error_times >= self.config.source_updater.max_error_times:
                     raise
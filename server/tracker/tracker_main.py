@@ -1,20 +1,25 @@
 from .db_manager import DBManager
 from schema.config import Config
 from utils.context import Context
-from searcher.searchers import Searchers
+from searcher.searchers import Searchers, SearcherWatcher
 from schema.api import *
 from .path_manager import PathManager
 from .local_manager import LocalManager
 from utils.path import ensure_path
 from downloader.download_manager import DownloadManager
 from .error_manager import ErrorManager
-from service.api_service import api, mock
+from service.api_service import api, mock, cached, stream, idempotent
 from .source_updater import SourceUpdater
 from .audio_manager import AudioManager
+from .audio_prefetcher import AudioPrefetcher
+from .faststart_fixer import FaststartFixer
+from .image_proxy import ImageProxy
 from datetime import datetime
 from schema.db import TV, LocalStore
 from monitor.monitors import Monitors
 from utils.run_cmd import run_cmd
+from utils import html_parser, thumbnail
+from searcher.resource_searcher.resolver_pool import ResolverPool
 
 
 class Tracker:
@@ -23,17 +28,28 @@ class Tracker:
         self.path = PathManager(config)
         self.db_manager = DBManager(self.config)
         self.downloader = DownloadManager(self.config.download)
+        self.audio_manager = AudioManager(config)
+        self.image_proxy = ImageProxy(config)
+        self.audio_prefetcher = AudioPrefetcher(
+            config, self.db_manager, self.audio_manager)
         self.local_manager = LocalManager(
-            config, self.db_manager, self.downloader)
+            config, self.db_manager, self.downloader, self.audio_prefetcher)
         self.error_manager = ErrorManager(config, self.db_manager)
         self.monitors = Monitors(config)
+        self.faststart_fixer = FaststartFixer(config, self.db_manager)
         self.source_updater = SourceUpdater(
             config, self.db_manager, self.local_manager)
-        self.audio_manager = AudioManager()
+        self.searcher_watcher = SearcherWatcher(
+            config.search.reload_interval.total_seconds())
+        self.resolver_pool = ResolverPool(
+            config) if config.browser.workers > 0 else None
 
     async def start(self):
         for path in self.path.required_path():
             ensure_path(path)
+        html_parser.start(self.config.parser.workers)
+        thumbnail.start(self.config.thumbnail.workers)
+        self.error_manager.start()
         self.context = Context(
             use_browser=True, config=self.config)
         self.context.error_handler.add_handler(
@@ -43,15 +59,27 @@ class Tracker:
         await self.context.__aenter__()
         await self.db_manager.start()
         self.context.meta["db_manager"] = self.db_manager
+        self.context.meta["resolver_pool"] = self.resolver_pool
         await self.local_manager.start()
         await self.source_updater.start()
         await self.monitors.start()
+        await self.searcher_watcher.start()
         self.audio_manager.start()
+        self.image_proxy.start()
+        await self.audio_prefetcher.start()
+        await self.faststart_fixer.start()
         self.searchers = Searchers()
 
     async def stop(self):
+        await self.searcher_watcher.stop()
+        await self.audio_prefetcher.stop()
+        await self.faststart_fixer.stop()
         await self.db_manager.stop()
+        if self.resolver_pool is not None:
+            await self.resolver_pool.close()
         await self.context.__aexit__(None, None, None)
+        html_parser.shutdown()
+        thumbnail.shutdown()
 
     async def __aenter__(self):
         await self.start()
@@ -62,11 +90,26 @@ class Tracker:
     def sync_stop(self):
         self.db_manager.save()
         self.audio_manager.close()
+        self.image_proxy.close()
+        if self.resolver_pool is not None:
+            self.resolver_pool.kill()
+        html_parser.shutdown()
+        thumbnail.shutdown()
 
     async def get_audio(self, path: str):
         return await self.audio_manager.get(path)
 
+    async def get_image(self, url: str, width: int = 0):
+        return await self.image_proxy.get(url, width)
+
+    def cached_audio(self, path: str):
+        return self.audio_manager.cached(path)
+
+    async def stream_audio(self, path: str, write):
+        return await self.audio_manager.stream(path, write)
+
     @api
+    @cached(lambda self, request: self.db_manager.version())
     async def monitor(self, request: Monitor.Request):
         version = self.db_manager.version()
         if request.version == version:
@@ -89,15 +132,16 @@ class Tracker:
                 tag=tv.tag,
                 watch=tv.watch,
                 total_episodes=total_episodes,
-                icon_url=self.path.cover_url(tv))
+                icon_url=self.path.icon_url(tv, request.icon_size))
         return Monitor.Response(
             is_new=request.version != version,
             version=version,
             tvs=[gen_tv(tv) for tv in tvs],
-            critical_errors=len(self.db_manager.error().critical_errors),
-            errors=len(self.db_manager.error().errors))
+            critical_errors=self.error_manager.critical_errors.count(),
+            errors=self.error_manager.errors.count())
 
     @api
+    @cached(lambda self, request: self.db_manager.tv_version(request.id))
     async def get_tv(self, request: GetTV.Request):
         tv = self.db_manager.tv(request.id)
         return GetTV.Response(
@@ -113,9 +157,40 @@ class Tracker:
                 for e in tv.local.episodes])
 
     @api
+    @idempotent
     async def search_tv(self, request: SearchTV.Request):
         return SearchTV.Response(source=await self.searchers.search(request.keyword))
 
+    @api
+    @stream
+    async def search_tv_stream(self, request: SearchTVStream.Request):
+        summary = SearchTVStream.Summary()
+        async for searcher, source, timeout in self.searchers.search_iter(
+                request.keyword, self.config.search.searcher_timeout.total_seconds()):
+            summary.searchers.append(searcher.key)
+            if timeout:
+                summary.timeout.append(searcher.key)
+            else:
+                yield SearchTVStream.Chunk(searcher=searcher.key, source=source)
+        yield SearchTVStream.Chunk(summary=summary)
+
+    @api
+    @idempotent
+    async def get_searcher_health(self, request: GetSearcherHealth.Request):
+        return GetSearcherHealth.Response(
+            searchers=[
+                GetSearcherHealth.Health(
+                    key=searcher.key,
+                    name=searcher.name,
+                    state=searcher.health.state,
+                    requests=len(searcher.health.records),
+                    success_rate=searcher.health.success_rate(),
+                    p50_latency=searcher.health.latency(0.5),
+                    p95_latency=searcher.health.latency(0.95),
+                    last_error=searcher.health.last_error,
+                    last_error_time=searcher.health.last_error_time)
+                for searcher in self.searchers.searcher_list])
+
     @api
     async def add_tv(self, request: AddTV.Request):
         tv_id = await self.local_manager.add_tv(request.name, request.source, request.tag)
@@ -132,6 +207,7 @@ class Tracker:
         return RemoveTV.Response()
 
     @api
+    @idempotent
     async def get_download_status(self, request: GetDownloadStatus.Request):
         status = self.downloader.get_status()
         return GetDownloadStatus.Response(
@@ -159,9 +235,16 @@ class Tracker:
                     resource="三月的狮子3", status="pending")])
 
     @api
+    @idempotent
     async def get_errors(self, request: GetErrors.Request):
-        error_db = self.db_manager.error()
-        return GetErrors.Response(critical_errors=reversed(error_db.critical_errors), errors=reversed(error_db.errors))
+        critical_errors = self.error_manager.critical_errors
+        errors = self.error_manager.errors
+        return GetErrors.Response(
+            critical_errors=critical_errors.page(
+                request.offset, request.limit),
+            errors=errors.page(request.offset, request.limit),
+            total_critical_errors=critical_errors.count(),
+            total_errors=errors.count())
 
     @mock
     async def mock_get_errors(self, request: GetErrors.Request):
@@ -171,12 +254,7 @@ class Tracker:
 
     @api
     async def clear_errors(self, request: ClearErrors.Request):
-        error_db = self.db_manager.error()
-        error_db.critical_errors = [
-            e for e in error_db.critical_errors if e.id not in request.ids]
-        error_db.errors = [
-            e for e in error_db.errors if e.id not in request.ids]
-        self.db_manager.error_dirty()
+        self.error_manager.clear(request.ids)
         return ClearErrors.Response()
 
     @api
@@ -185,9 +263,11 @@ class Tracker:
         tv.watch = request.watch
         tv.touch_time = datetime.now()
         self.db_manager.tv_dirty(tv)
+        self.audio_prefetcher.submit(tv.id)
         return SetWatch.Response()
 
     @api
+    @cached(lambda self, request: 0)
     async def get_config(self, request: GetConfig.Request):
         return GetConfig.Response(
             watched_ratio=self.config.tracker.watched_ratio,
@@ -204,6 +284,7 @@ class Tracker:
         tv.tag = request.tag
         tv.touch_time = datetime.now()
         self.db_manager.tv_dirty(tv)
+        self.audio_prefetcher.submit(tv.id)
         return SetTag.Response()
 
     @api
@@ -232,6 +313,7 @@ class Tracker:
         return UpdateSource.Response()
 
     @api
+    @idempotent
     async def get_system_monitor(self, request: GetSystemMonitor.Request):
         cfg = None
         for m in self.config.system_status.monitor:
@@ -246,6 +328,7 @@ class Tracker:
             result=stdout)
 
     @api
+    @idempotent
     async def get_system_operation(self, request: GetSystemOperation.Request):
         return GetSystemOperation.Response(
             result=[
@@ -0,0 +1,63 @@
+from schema.config import SourceUpdaterConfig
+from schema.db import TV, UpdateSchedule
+from datetime import datetime, timedelta
+import math
+
+
+class UpdateScheduler:
+    def __init__(self, config: SourceUpdaterConfig):
+        self.config = config
+
+    def due(self, schedule: UpdateSchedule, now: datetime):
+        return schedule.next_update is None or schedule.next_update <= now
+
+    def period(self, schedule: UpdateSchedule):
+        if len(schedule.releases) < self.config.min_release_history:
+            return None
+        gaps = sorted(b - a for a, b in zip(
+            schedule.releases, schedule.releases[1:]))
+        return gaps[len(gaps) // 2]
+
+    def base_interval(self, tv: TV):
+        return self.config.update_interval * self.config.tag_interval_scale.get(tv.tag, 1)
+
+    def backoff(self, base: timedelta, exponent: int):
+        if base <= timedelta(0) or base >= self.config.max_interval:
+            return base
+        limit = math.ceil(math.log2(self.config.max_interval / base))
+        return base * 2 ** min(exponent, limit)
+
+    def interval(self, tv: TV, schedule: UpdateSchedule, now: datetime):
+        base = self.base_interval(tv)
+        if schedule.error_times > 0:
+            return self.backoff(base, schedule.error_times)
+        if not schedule.releases:
+            return base
+        period = self.period(schedule)
+        if period is None:
+            quiet = now - schedule.releases[-1]
+            return self.backoff(base, int(quiet / self.config.quiet_timeout))
+        window = self.config.release_window
+        expected = schedule.releases[-1] + period
+        if now < expected - window:
+            return max(expected - window - now, base)
+        late = now - (expected + window)
+        if late <= timedelta(0):
+            return base
+        return self.backoff(base, 1 + int(late / window))
+
+    def reschedule(self, tv: TV, schedule: UpdateSchedule, now: datetime, updated: bool, error: bool):
+        if updated:
+            schedule.releases.append(now)
+            schedule.releases = schedule.releases[-self.config.release_history:]
+        elif not schedule.releases and tv.source.latest_update is not None:
+            schedule.releases.append(tv.source.latest_update)
+        schedule.error_times = schedule.error_times + 1 if error else 0
+        interval = min(self.interval(tv, schedule, now),
+                       self.config.max_interval)
+        schedule.next_update = now + interval
+
+    def defer(self, tv: TV, schedule: UpdateSchedule, now: datetime):
+        interval = min(self.interval(tv, schedule, now),
+                       self.config.max_interval)
+        schedule.next_update = now + interval
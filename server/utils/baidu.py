@@ -1,5 +1,9 @@
 from .context import Context
 from .beautiful import request
+from . import fixture, http_client
+from .parallel_runner import bounded_gather
+from collections import OrderedDict
+import json
 
 HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
@@ -10,6 +14,10 @@ HEADERS = {
     "Accept-Language": "zh-CN,zh;q=0.9"
 }
 
+_RESOLVE_CONCURRENT = 8
+_REDIRECT_CACHE_SIZE = 4096
+_redirect_cache = OrderedDict()
+
 
 async def baidu_search(query: str):
     try:
@@ -23,24 +31,34 @@ async def baidu_search(query: str):
 
 async def baidu_search_by_api(query: str):
     api_key = Context.current.config.api_key.serp_api
-    url = f"https://serpapi.com/search.json?engine=baidu&q={query}&api_key={api_key}"
-    async with Context.current.client.get(url) as resp:
-        data = await resp.json()
-        return [i['link'] for i in data.get("organic_results", [])]
+    url = f"https://serpapi.com/search.json?engine=baidu&q={query}"
+    async with http_client.get(fixture.replay_url(url), params={"api_key": api_key}) as resp:
+        text = await resp.text()
+        fixture.record(url, resp, text)
+    data = json.loads(text)
+    return [i['link'] for i in data.get("organic_results", [])]
 
 
 async def baidu_search_by_html(query: str):
     url = f"https://www.baidu.com/s?ie=utf-8&tn=baidu&wd={query}"
     soup = await request(url)
     links = soup.select("a.sc-link")
-    return [await get_raw_html(i.get("href")) for i in links]
+    return await bounded_gather([get_raw_html(i.get("href")) for i in links], _RESOLVE_CONCURRENT)
 
 
 async def get_raw_html(url: str):
-    async with Context.current.client.get(url, headers=HEADERS, allow_redirects=False) as resp:
+    if url in _redirect_cache:
+        _redirect_cache.move_to_end(url)
+        return _redirect_cache[url]
+    async with http_client.get(fixture.replay_url(url), headers=HEADERS, allow_redirects=False) as resp:
+        fixture.record(url, resp, await resp.text())
         if resp.status != 302:
             raise ValueError(f"unexpected status code: {resp.status}")
-        return resp.headers.get("Location")
+        location = resp.headers.get("Location")
+    _redirect_cache[url] = location
+    while len(_redirect_cache) > _REDIRECT_CACHE_SIZE:
+        _redirect_cache.popitem(last=False)
+    return location
 
 if __name__ == "__main__":
     import asyncio
@@ -1,6 +1,8 @@
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString
-from utils.context import Context
+from utils import fixture, http_client
+from dataclasses import dataclass
+from typing import Optional
 import asyncio
 import json
 
@@ -10,30 +12,60 @@ HEADERS = {
 }
 
 
-async def request(url, headers=HEADERS, retry=3):
-    async with Context.client.get(url, headers=headers) as response:
-        if response.status == 429:
-            if retry > 0:
-                await asyncio.sleep(5)
-                return await request(url, headers, retry - 1)
+async def request_text(url, headers=HEADERS, retry=None):
+    async with http_client.get(fixture.replay_url(url), retry=retry, headers=headers) as response:
         if response.status != 200:
             raise RuntimeError(
                 f"cannot get result status_code={response.status}"
             )
-        return BeautifulSoup(await response.text(), features="lxml")
+        text = await response.text()
+        fixture.record(url, response, text)
+        return text
 
 
-async def request_json(url, headers=HEADERS, retry=3):
-    async with Context.client.get(url, headers=headers) as response:
-        if response.status == 429:
-            if retry > 0:
-                await asyncio.sleep(5)
-                return await request(url, headers, retry - 1)
+async def request(url, headers=HEADERS, retry=None):
+    text = await request_text(url, headers, retry)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, BeautifulSoup, text, "lxml")
+
+
+@dataclass
+class Page:
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+async def request_page(url, etag=None, last_modified=None, headers=HEADERS, retry=None):
+    conditional_headers = dict(headers)
+    if etag:
+        conditional_headers["If-None-Match"] = etag
+    if last_modified:
+        conditional_headers["If-Modified-Since"] = last_modified
+    async with http_client.get(fixture.replay_url(url), retry=retry, headers=conditional_headers) as response:
+        if response.status == 304:
+            return None
+        if response.status != 200:
+            raise RuntimeError(
+                f"cannot get result status_code={response.status}"
+            )
+        text = await response.text()
+        fixture.record(url, response, text)
+        return Page(
+            text=text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"))
+
+
+async def request_json(url, headers=HEADERS, retry=None):
+    async with http_client.get(fixture.replay_url(url), retry=retry, headers=headers) as response:
         if response.status != 200:
             raise RuntimeError(
                 f"cannot get result status_code={response.status}"
             )
-        return json.loads(await response.text())
+        text = await response.text()
+        fixture.record(url, response, text)
+        return json.loads(text)
 
 
 def to_text(token):
@@ -0,0 +1,116 @@
+from playwright.async_api import async_playwright
+from contextlib import asynccontextmanager
+from .timer import Timer
+import asyncio
+import time
+
+_REAP_INTERVAL = 30
+
+
+class BrowserManager:
+    def __init__(self, idle_timeout, logger=None):
+        self.idle_timeout = idle_timeout
+        self.logger = logger
+        self.lock = asyncio.Lock()
+        self.playwright = None
+        self.playwright_ctx = None
+        self.browser = None
+        self.active = 0
+        self.last_used = time.monotonic()
+        self.timer = Timer(self.reap, min(idle_timeout, _REAP_INTERVAL))
+
+    def log(self, msg):
+        if self.logger is not None:
+            self.logger.info(msg)
+
+    async def start(self):
+        await self.timer.start()
+
+    async def stop(self):
+        await self.timer.stop()
+        async with self.lock:
+            await self.close()
+
+    async def close(self):
+        browser, playwright = self.browser, self.playwright
+        self.browser = None
+        self.playwright = None
+        self.playwright_ctx = None
+        if browser is not None:
+            try:
+                await browser.close()
+            except BaseException:
+                pass
+        if playwright is not None:
+            try:
+                await playwright.__aexit__(None, None, None)
+            except BaseException:
+                pass
+
+    def on_disconnected(self, browser):
+        if browser is self.browser:
+            self.log("browser disconnected")
+            self.browser = None
+
+    async def launch(self):
+        async with self.lock:
+            if self.browser is None or not self.browser.is_connected():
+                await self.close()
+                self.log("launch browser")
+                self.playwright = async_playwright()
+                self.playwright_ctx = await self.playwright.__aenter__()
+                self.browser = await self.playwright_ctx.chromium.launch()
+                self.browser.on("disconnected", self.on_disconnected)
+            return self.browser
+
+    async def new_page(self):
+        browser = await self.launch()
+        try:
+            return await browser.new_page()
+        except Exception:
+            if browser.is_connected():
+                raise
+        browser = await self.launch()
+        return await browser.new_page()
+
+    @asynccontextmanager
+    async def page(self):
+        self.active += 1
+        try:
+            page = await self.new_page()
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+        finally:
+            self.active -= 1
+            self.last_used = time.monotonic()
+
+    async def reap(self):
+        if self.browser is None or self.active > 0:
+            return
+        if time.monotonic() - self.last_used < self.idle_timeout:
+            return
+        async with self.lock:
+            if self.browser is not None and self.active == 0:
+                self.log("close idle browser")
+                await self.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    async def main():
+        manager = BrowserManager(2)
+        await manager.start()
+        async with manager.page() as page:
+            await page.goto(sys.argv[-1])
+            print(await page.title())
+        print(manager.browser is not None)
+        await asyncio.sleep(3)
+        print(manager.browser is not None)
+        await manager.stop()
+    asyncio.run(main())
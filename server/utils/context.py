@@ -1,9 +1,9 @@
-from playwright.async_api import async_playwright
 import aiohttp
 import threading
 from .temp_manager import TempManager
 from .error_handler import ErrorHandler
 from .logger import get_logger
+from .browser_manager import BrowserManager
 from schema.config import Config
 
 
@@ -64,8 +64,6 @@ class Context(metaclass=ContextMeta):
         self.tmp_dir = config.download.tmp_dir
         self.use_client = use_client
         self.use_browser = use_browser
-        self.playwright = None
-        self.playwright_ctx = None
         self.browser = None
         self.client = None
         self.error_handler = ErrorHandler()
@@ -85,23 +83,17 @@ class Context(metaclass=ContextMeta):
                 timeout=aiohttp.ClientTimeout(total=10))
             await self.client.__aenter__()
         if self.use_browser:
-            self.playwright = async_playwright()
-            self.playwright_ctx = await self.playwright.__aenter__()
-            self.browser = await self.playwright_ctx.chromium.launch()
+            self.browser = BrowserManager(
+                self.config.browser.idle_timeout.total_seconds(), self.logger)
+            await self.browser.start()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         if self.use_browser:
             try:
-                await self.browser.close()
+                await self.browser.stop()
             except BaseException:
                 pass
-            try:
-                await self.playwright.__aexit__(exc_type, exc, tb)
-            except BaseException:
-                pass
-            self.playwright_ctx = None
-            self.playwright = None
             self.browser = None
         if self.use_client:
             try:
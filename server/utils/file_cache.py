@@ -1,41 +1,121 @@
-from utils.context import Context
+from utils.path import atomic_file_write, ensure_path
+from utils.single_flight import SingleFlight
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
+import json
+import os
+
+_INDEX_FILE = "index.json"
+_TMP_PREFIX = "tmp-"
 
 
 @dataclass
 class ManagedFile:
     key: str
     file: str
+    size: int
 
 
 class FileCache:
-    def __init__(self, ext, max_file_count=10):
-        self.max_file_count = max_file_count
+    def __init__(self, path, ext, max_bytes):
+        self.path = path
         self.ext = ext
+        self.max_bytes = max_bytes
+        self.managed_file = OrderedDict()
+        self.total_bytes = 0
+        self.flight = SingleFlight()
+
+    def index_file(self):
+        return os.path.join(self.path, _INDEX_FILE)
+
+    def file_name(self, key):
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + "." + self.ext
+
+    def tmp_file(self, key):
+        return os.path.join(self.path, _TMP_PREFIX + self.file_name(key))
 
     def start(self):
-        self.tmp = Context.tempdir()
-        self.tmp.start()
-        self.managed_file = [ManagedFile("", self.tmp.allocate_file(
-            f"{i}.{self.ext}")) for i in range(self.max_file_count)]
+        ensure_path(self.path)
+        if os.path.exists(self.index_file()):
+            with open(self.index_file()) as f:
+                for key, name, size in json.load(f):
+                    file = os.path.join(self.path, name)
+                    if os.path.exists(file):
+                        self.managed_file[key] = ManagedFile(key, file, size)
+                        self.total_bytes += size
+        known = {os.path.basename(item.file)
+                 for item in self.managed_file.values()}
+        known.add(_INDEX_FILE)
+        for name in os.listdir(self.path):
+            if name not in known:
+                os.remove(os.path.join(self.path, name))
+        self.evict()
+        self.save()
 
     def close(self):
-        self.tmp.close()
+        self.save()
+
+    def save(self):
+        index = [[item.key, os.path.basename(item.file), item.size]
+                 for item in self.managed_file.values()]
+        atomic_file_write(self.index_file(), json.dumps(index))
+
+    def evict(self):
+        while self.total_bytes > self.max_bytes and len(self.managed_file) > 1:
+            _, item = self.managed_file.popitem(last=False)
+            self.total_bytes -= item.size
+            try:
+                os.remove(item.file)
+            except FileNotFoundError:
+                pass
+
+    def lookup(self, key):
+        item = self.managed_file.get(key)
+        if item is None:
+            return None
+        self.managed_file.move_to_end(key)
+        return item.file
 
     async def get(self, key, creator):
-        for item in self.managed_file:
-            if item.key == key:
-                self.managed_file.remove(item)
-                self.managed_file.append(item)
-                return item.file
-        file = self.managed_file[0]
-        self.managed_file.remove(file)
+        file = self.lookup(key)
+        if file is not None:
+            return file
+        return await self.flight.do(key, lambda: self.create(key, creator))
+
+    async def create(self, key, creator):
+        file = os.path.join(self.path, self.file_name(key))
+        tmp = self.tmp_file(key)
         try:
-            await creator(file.file)
-            file.key = key
-            self.managed_file.append(file)
-        except:
-            file.key = ""
-            self.managed_file = [file] + self.managed_file
+            await creator(tmp)
+            os.replace(tmp, file)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
             raise
-        return file.file
+        item = ManagedFile(key, file, os.path.getsize(file))
+        self.managed_file[key] = item
+        self.total_bytes += item.size
+        self.evict()
+        self.save()
+        return file
+
+
+if __name__ == "__main__":
+    import asyncio
+    import sys
+
+    async def creator(file):
+        await asyncio.sleep(0.5)
+        with open(file, "w") as f:
+            f.write("x" * 10)
+
+    async def test():
+        cache = FileCache(sys.argv[-1], "txt", 25)
+        cache.start()
+        print(await asyncio.gather(*[cache.get("a", creator) for _ in range(3)]))
+        await cache.get("b", creator)
+        await cache.get("c", creator)
+        print(list(cache.managed_file), cache.total_bytes)
+        cache.close()
+    asyncio.run(test())
@@ -0,0 +1,60 @@
+from utils.path import atomic_file_write, ensure_path
+from urllib.parse import quote
+import hashlib
+import json
+import os
+
+RECORD_ENV = "TV_TRACK_RECORD_DIR"
+REPLAY_ENV = "TV_TRACK_REPLAY_URL"
+
+
+def fixture_name(url):
+    return hashlib.sha1(url.encode()).hexdigest() + ".json"
+
+
+def replay_url(url):
+    replay = os.environ.get(REPLAY_ENV)
+    if not replay:
+        return url
+    return f"{replay.rstrip('/')}/replay?url={quote(url, safe='')}"
+
+
+def record(url, response, text):
+    record_dir = os.environ.get(RECORD_ENV)
+    if not record_dir or response.status not in (200, 302):
+        return
+    ensure_path(record_dir)
+    atomic_file_write(os.path.join(record_dir, fixture_name(url)), json.dumps({
+        "url": url,
+        "status": response.status,
+        "content_type": response.headers.get("Content-Type", "text/html"),
+        "location": response.headers.get("Location"),
+        "body": text,
+    }, ensure_ascii=False))
+
+
+def replay_routes(fixture_dir):
+    from aiohttp import web
+
+    async def replay(request):
+        url = request.query.get("url", "")
+        path = os.path.join(fixture_dir, fixture_name(url))
+        if not os.path.exists(path):
+            return web.Response(status=404, text=f"no fixture for {url}")
+        with open(path, "r") as f:
+            fixture = json.load(f)
+        headers = {"Content-Type": fixture["content_type"]}
+        if fixture.get("location"):
+            headers["Location"] = fixture["location"]
+        return web.Response(
+            status=fixture["status"], text=fixture["body"], headers=headers)
+    return [web.get("/replay", replay)]
+
+
+if __name__ == "__main__":
+    from aiohttp import web
+    import sys
+
+    app = web.Application()
+    app.add_routes(replay_routes(sys.argv[-2]))
+    web.run_app(app, host="127.0.0.1", port=int(sys.argv[-1]))
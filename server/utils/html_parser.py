@@ -0,0 +1,48 @@
+from functools import lru_cache
+from bs4 import BeautifulSoup
+from utils.context import Context
+from utils.process_pool import ProcessPool
+import soupsieve
+
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    return soupsieve.compile(selector)
+
+
+def select(tag, selector):
+    return compile_selector(selector).select(tag)
+
+
+def select_one(tag, selector):
+    return compile_selector(selector).select_one(tag)
+
+
+def _init_worker():
+    from searcher.searchers import searcher_registry
+    try:
+        searcher_registry()
+    except Exception:
+        pass
+
+
+_pool = ProcessPool("html parser", _init_worker)
+
+
+def start(workers):
+    _pool.start(workers)
+
+
+def shutdown():
+    _pool.shutdown()
+
+
+def _parse(func, src, text, features, args):
+    return func(src, BeautifulSoup(text, features=features), *args)
+
+
+async def parse_html(func, src, text, features="lxml", *args):
+    if _pool.executor is None:
+        start(Context.current.config.parser.workers)
+    return await _pool.run(_parse, func, src, text, features, args)
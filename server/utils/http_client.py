@@ -0,0 +1,42 @@
+from contextlib import asynccontextmanager
+from functools import cache
+from urllib.parse import urlparse
+from utils.context import Context
+from utils.rate_limiter import RateLimiter, parse_retry_after
+
+_RETRY_STATUS = (429, 503)
+
+
+@cache
+def rate_limiter():
+    config = Context.current.config.http
+    return RateLimiter(
+        config.rate, config.burst,
+        config.backoff_base.total_seconds(),
+        config.backoff_max.total_seconds(),
+        config.domain_rate)
+
+
+@asynccontextmanager
+async def get(url, retry=None, use_bucket=True, **kwargs):
+    limiter = rate_limiter()
+    host = urlparse(url).hostname or ""
+    if retry is None:
+        retry = Context.current.config.http.max_retry
+    attempt = 0
+    while True:
+        await limiter.acquire(host, use_bucket)
+        response = await Context.client.get(url, **kwargs)
+        if response.status in _RETRY_STATUS and attempt < retry:
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = limiter.backoff(attempt)
+            limiter.cooldown(host, delay)
+            response.release()
+            attempt += 1
+            continue
+        try:
+            yield response
+        finally:
+            response.release()
+        return
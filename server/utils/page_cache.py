@@ -0,0 +1,30 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class PageState:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: str = ""
+    region_digest: str = ""
+    result: Any = None
+
+
+class PageCache:
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.pages = OrderedDict()
+
+    def get(self, url):
+        state = self.pages.get(url)
+        if state is not None:
+            self.pages.move_to_end(url)
+        return state
+
+    def put(self, url, state: PageState):
+        self.pages[url] = state
+        self.pages.move_to_end(url)
+        while len(self.pages) > self.max_size:
+            self.pages.popitem(last=False)
@@ -1,6 +1,15 @@
 import asyncio
 
 
+async def bounded_gather(coros, limit, return_exceptions=False):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    return await asyncio.gather(*[run(coro) for coro in coros], return_exceptions=return_exceptions)
+
+
 class ParallelRunner:
     def __init__(self, max_concurrent):
         self._max_concurrent = max_concurrent
@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from utils.context import Context
+import multiprocessing
+import asyncio
+
+
+class ProcessPool:
+    def __init__(self, name, initializer=None):
+        self.name = name
+        self.initializer = initializer
+        self.executor = None
+        self.workers = 0
+
+    def start(self, workers):
+        if self.executor is not None or workers <= 0:
+            return
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=self.initializer,
+            mp_context=multiprocessing.get_context("forkserver"))
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def restart(self, executor):
+        if self.executor is executor:
+            Context.warning(f"{self.name} process pool broken, restarting")
+            self.shutdown()
+            self.start(self.workers)
+
+    async def run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            if executor is None:
+                raise
+            self.restart(executor)
+        return await loop.run_in_executor(self.executor, func, *args)
+
+
+if __name__ == "__main__":
+    from schema.config import Config
+    import os
+
+    async def test():
+        async with Context(Config(), use_client=False):
+            pool = ProcessPool("test")
+            pool.start(1)
+            print(await pool.run(os.getpid))
+            pool.executor.submit(os._exit, 1)
+            await asyncio.sleep(0.5)
+            print(await pool.run(os.getpid))
+            pool.shutdown()
+    asyncio.run(test())
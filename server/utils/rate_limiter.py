@@ -0,0 +1,89 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import asyncio
+import random
+import time
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens +
+                              (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    def __init__(self, rate, burst, backoff_base, backoff_max, domain_rate=None):
+        self.rate = rate
+        self.burst = burst
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.domain_rate = domain_rate or {}
+        self.buckets = {}
+        self.cooldown_until = {}
+
+    def bucket(self, host):
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(
+                self.domain_rate.get(host, self.rate), self.burst)
+        return self.buckets[host]
+
+    async def acquire(self, host, use_bucket=True):
+        while True:
+            wait = self.cooldown_until.get(host, 0) - time.monotonic()
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        if use_bucket:
+            await self.bucket(host).acquire()
+
+    def backoff(self, attempt):
+        delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+    def cooldown(self, host, seconds):
+        self.cooldown_until[host] = max(
+            self.cooldown_until.get(host, 0), time.monotonic() + seconds)
+
+
+if __name__ == "__main__":
+    async def worker(limiter, name):
+        await limiter.acquire("example.com")
+        print(f"{time.time():.2f} {name}")
+
+    async def test():
+        limiter = RateLimiter(2, 2, 1, 10)
+        await asyncio.gather(*[worker(limiter, i) for i in range(4)])
+        limiter.cooldown("example.com", 1)
+        await asyncio.gather(*[worker(limiter, i) for i in range(2)])
+        print(parse_retry_after("3"), parse_retry_after(
+            "Wed, 21 Oct 2015 07:28:00 GMT"))
+    asyncio.run(test())
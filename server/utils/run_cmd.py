@@ -1,4 +1,14 @@
 import asyncio
+import shutil
+
+
+def low_priority_cmd():
+    cmd = []
+    if shutil.which("nice"):
+        cmd += ["nice", "-n", "19"]
+    if shutil.which("ionice"):
+        cmd += ["ionice", "-c", "3"]
+    return cmd
 
 
 async def run_cmd(*cmd):
@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+
+class SingleFlight:
+    def __init__(self, ttl=0):
+        self.ttl = ttl
+        self.flights = {}
+        self.results = {}
+
+    async def do(self, key, func):
+        now = time.monotonic()
+        if key in self.results:
+            expire, result = self.results[key]
+            if expire > now:
+                return result
+            del self.results[key]
+        if key not in self.flights:
+            self.flights[key] = asyncio.ensure_future(self._run(key, func))
+        return await asyncio.shield(self.flights[key])
+
+    async def _run(self, key, func):
+        try:
+            result = await func()
+            if self.ttl > 0:
+                now = time.monotonic()
+                self.results = {
+                    k: v for k, v in self.results.items() if v[0] > now}
+                self.results[key] = (now + self.ttl, result)
+            return result
+        finally:
+            del self.flights[key]
+
+
+if __name__ == "__main__":
+    async def fetch(key):
+        print(f"FETCH: {key}")
+        await asyncio.sleep(1)
+        return key * 2
+
+    async def test():
+        flight = SingleFlight(ttl=2)
+        print(await asyncio.gather(*[
+            flight.do(i % 2, lambda i=i: fetch(i % 2)) for i in range(6)]))
+        print(await flight.do(1, lambda: fetch(1)))
+        await asyncio.sleep(2)
+        print(await flight.do(1, lambda: fetch(1)))
+    asyncio.run(test())
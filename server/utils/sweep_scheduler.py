@@ -0,0 +1,37 @@
+import asyncio
+import random
+from collections import defaultdict
+
+
+class SweepScheduler:
+    def __init__(self, max_concurrent, max_group_concurrent, spread):
+        self.spread = spread
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.group_semaphores = defaultdict(
+            lambda: asyncio.Semaphore(max_group_concurrent))
+
+    async def _run(self, group, delay, func):
+        await asyncio.sleep(delay)
+        async with self.group_semaphores[group]:
+            async with self.semaphore:
+                await func()
+
+    async def run(self, jobs):
+        await asyncio.gather(*[
+            self._run(group, random.uniform(0, self.spread), func)
+            for group, func in jobs])
+
+
+if __name__ == "__main__":
+    import time
+
+    async def test_task(name):
+        print(f"{time.time():.2f} START: {name}")
+        await asyncio.sleep(1)
+        print(f"{time.time():.2f} END: {name}")
+
+    async def test():
+        scheduler = SweepScheduler(3, 1, 2)
+        await scheduler.run([
+            (i % 2, lambda i=i: test_task(f"{i % 2}-{i}")) for i in range(6)])
+    asyncio.run(test())
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from utils.context import Context
+from utils.single_flight import SingleFlight
+import asyncio
+import time
+
+
+class SWRCache:
+    def __init__(self, ttl, stale_ttl, max_size):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.refreshing = {}
+        self.flight = SingleFlight()
+
+    async def get(self, key, fetch):
+        if key in self.items:
+            timestamp, value = self.items[key]
+            age = time.monotonic() - timestamp
+            if age < self.ttl + self.stale_ttl:
+                self.items.move_to_end(key)
+                if age >= self.ttl:
+                    self._refresh(key, fetch)
+                return value
+            del self.items[key]
+        return await self.flight.do(key, lambda: self._fetch(key, fetch))
+
+    def invalidate(self, match):
+        for key in [key for key in self.items if match(key)]:
+            del self.items[key]
+
+    async def _fetch(self, key, fetch):
+        value = await fetch()
+        self.items[key] = (time.monotonic(), value)
+        self.items.move_to_end(key)
+        while len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+        return value
+
+    def _refresh(self, key, fetch):
+        if key in self.refreshing:
+            return
+        task = asyncio.create_task(self._background_fetch(key, fetch))
+        self.refreshing[key] = task
+        task.add_done_callback(lambda _: self.refreshing.pop(key, None))
+
+    async def _background_fetch(self, key, fetch):
+        try:
+            await self.flight.do(key, lambda: self._fetch(key, fetch))
+        except Exception as e:
+            Context.warning(f"refresh {key} error: {e!r}")
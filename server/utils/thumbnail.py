@@ -0,0 +1,75 @@
+from utils.context import Context
+from utils.path import atomic_file_write
+from utils.process_pool import ProcessPool
+import asyncio
+import hashlib
+import io
+import os
+
+_pool = ProcessPool("thumbnail")
+_QUALITY = 85
+
+
+def start(workers):
+    _pool.start(workers)
+
+
+def shutdown():
+    _pool.shutdown()
+
+
+def content_hash(data):
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def thumbnail_name(prefix, digest, size):
+    return f"{prefix}-{digest}-{size}.jpg"
+
+
+def _resize(data, size):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        if image.width > size:
+            height = max(1, round(image.height * size / image.width))
+            image = image.resize((size, height), Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=_QUALITY, optimize=True)
+        return out.getvalue()
+
+
+async def resize(data, size):
+    if _pool.executor is None:
+        start(Context.current.config.thumbnail.workers)
+    return await _pool.run(_resize, data, size)
+
+
+async def make_thumbnails(data, sizes, directory, prefix):
+    digest = content_hash(data)
+    result = {}
+    for size in sizes:
+        name = thumbnail_name(prefix, digest, size)
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            atomic_file_write(path, await resize(data, size))
+        result[size] = name
+    return result
+
+
+def pick_size(sizes, size):
+    if not sizes:
+        return None
+    larger = [s for s in sizes if s >= size]
+    return min(larger) if larger else max(sizes)
+
+
+if __name__ == "__main__":
+    import sys
+
+    async def test():
+        start(1)
+        with open(sys.argv[-2], "rb") as f:
+            data = f.read()
+        print(await make_thumbnails(data, [128, 256], sys.argv[-1], "cover"))
+    asyncio.run(test())
@@ -34,6 +34,7 @@ export namespace monitor {
     }
     export interface Request {
         version: string
+        icon_size?: number
     }
 
     export interface Response {
@@ -88,10 +89,13 @@ export namespace get_errors {
         timestamp: string
         title: string
         error: string
+        count: number
     }
     export interface Response {
         critical_errors: Error[]
         errors: Error[]
+        total_critical_errors: number
+        total_errors: number
     }
 }
 